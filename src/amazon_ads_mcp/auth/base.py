@@ -11,7 +11,8 @@ implement a custom authentication provider.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
 
 from ..models import AuthCredentials, Identity, Token
 from ..utils.region_config import RegionConfig
@@ -65,6 +66,22 @@ class BaseAuthProvider(ABC):
         """Clean up provider resources."""
         pass
 
+    async def __aenter__(self) -> "BaseAuthProvider":
+        """Enter an ``async with`` block that closes the provider on exit.
+
+        :return: The provider itself.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Close the provider, whether or not the block raised."""
+        await self.close()
+
 
 class BaseIdentityProvider(ABC):
     """Provide multi-identity capabilities for providers.
@@ -12,6 +12,7 @@ The module provides:
 """
 
 import logging
+import re
 from typing import Optional
 
 import httpx
@@ -19,6 +20,26 @@ from fastmcp import Context
 
 logger = logging.getLogger(__name__)
 
+# Header name fragments forwarded by MCP clients that must not reach the
+# Amazon Ads API, matched in a single pass per header name
+_POLLUTED_HEADER_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "authorization",
+                "clientid",
+                "client-id",
+                "client_id",
+                "amazon-ads",
+                "amazon-advertising",
+                "scope",
+            ),
+        )
+    ),
+    re.IGNORECASE,
+)
+
 
 class AuthHeaderHook:
     """Request hook that adds authentication headers to outgoing requests.
@@ -75,7 +96,8 @@ class AuthHeaderHook:
         try:
             # Get auth headers from manager
             auth_headers = await self.auth_manager.get_headers()
-            logger.debug(f"Got auth headers: {list(auth_headers.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Got auth headers: %s", list(auth_headers))
         except Exception as e:
             logger.error(f"Failed to get auth headers: {e}")
             return request
@@ -85,19 +107,7 @@ class AuthHeaderHook:
         # shouldn't go to the Amazon Ads API
         polluted_headers = []
         for key in list(request.headers.keys()):
-            key_lower = key.lower()
-            if any(
-                pattern in key_lower
-                for pattern in [
-                    "authorization",
-                    "clientid",
-                    "client-id",
-                    "client_id",
-                    "amazon-ads",
-                    "amazon-advertising",
-                    "scope",
-                ]
-            ):
+            if _POLLUTED_HEADER_RE.search(key):
                 polluted_headers.append(key)
                 del request.headers[key]
 
@@ -112,8 +122,8 @@ class AuthHeaderHook:
         # Handle profiles endpoint special case
         # The /v2/profiles endpoint when listing (no profileId in URL)
         # doesn't accept the Scope header
+        # get_headers() builds a fresh dict per call, so it is ours to edit
         if "/v2/profiles" in url and "profileId" not in url:
-            auth_headers = auth_headers.copy()
             auth_headers.pop("Amazon-Advertising-API-Scope", None)
             logger.debug("Removed Scope header for profiles listing endpoint")
 
@@ -148,12 +158,10 @@ class AuthHeaderHook:
         """
         # Log auth-related errors with more detail
         if response.status_code == 401:
-            error_detail = ""
-            try:
-                error_body = response.json()
-                error_detail = f" - Error: {error_body}"
-            except:
-                error_detail = f" - Response: {response.text[:200]}"
+            # A raw preview is enough for the log line; decode only the
+            # leading bytes instead of the whole body
+            preview = response.content[:200].decode("utf-8", "replace")
+            error_detail = f" - Response: {preview}"
 
             logger.error(f"Received 401 Unauthorized - token may be expired or invalid{error_detail}")
             logger.error(f"Request URL: {response.request.url}")
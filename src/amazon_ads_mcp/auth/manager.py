@@ -14,7 +14,7 @@ The module supports:
 
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from ..config.settings import Settings
@@ -33,6 +33,9 @@ from .token_store import (
 
 logger = logging.getLogger(__name__)
 
+# Reused credentials must outlive the request they are attached to
+CREDENTIAL_REUSE_MARGIN = timedelta(seconds=60)
+
 
 class AuthManager:
     """Central manager for authentication and identity management.
@@ -364,6 +367,20 @@ class AuthManager:
         """
         return self._active_identity
 
+    @staticmethod
+    def _credentials_fresh(credentials: AuthCredentials) -> bool:
+        """Check that credentials stay valid past the reuse margin.
+
+        :param credentials: Credentials to check
+        :type credentials: AuthCredentials
+        :return: True if they can be reused for another request
+        :rtype: bool
+        """
+        expires_at = credentials.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) + CREDENTIAL_REUSE_MARGIN < expires_at
+
     async def get_active_credentials(self) -> AuthCredentials:
         """Get credentials for the active identity.
 
@@ -393,7 +410,20 @@ class AuthManager:
                     )
 
             identity_id = self._active_identity.id
-            logger.info(f"Getting credentials for active identity: {identity_id}")
+            logger.debug("Getting credentials for active identity: %s", identity_id)
+
+            # Identity-specific headers cannot be rebuilt from the cached
+            # token below, which would mean a provider round trip on every
+            # request; reuse the last full credentials while still valid
+            creds = self._active_credentials
+            if (
+                creds
+                and creds.identity_id == identity_id
+                and getattr(self.provider, "headers_are_identity_specific", None)
+                and self.provider.headers_are_identity_specific()
+                and self._credentials_fresh(creds)
+            ):
+                return creds
 
             # Try to get cached credentials from token store
             cached_access = await self.get_token(
@@ -409,8 +439,9 @@ class AuthManager:
                     hasattr(self.provider, "headers_are_identity_specific")
                     and self.provider.headers_are_identity_specific()
                 ):
-                    logger.info(
-                        f"{self.provider.provider_type}: Need full credentials, not just cached token"
+                    logger.debug(
+                        "%s: Need full credentials, not just cached token",
+                        self.provider.provider_type,
                     )
                     # Fall through to fetch fresh credentials
                 else:
@@ -433,18 +464,17 @@ class AuthManager:
                     self._active_credentials = creds
                     return creds
             elif cached_access:
-                logger.info(f"Credentials for {identity_id} expired, refreshing")
+                logger.info("Credentials for %s expired, refreshing", identity_id)
 
             # Get new credentials
-            logger.info(
-                f"Fetching fresh credentials from {self.provider.provider_type} for identity {identity_id}"
+            logger.debug(
+                "Fetching fresh credentials from %s for identity %s",
+                self.provider.provider_type,
+                identity_id,
             )
             credentials = await self.provider.get_identity_credentials(identity_id)
-            logger.info(
-                f"Got credentials with headers: {list(credentials.headers.keys())}"
-            )
-            logger.info(
-                f"Client ID in credentials: {credentials.headers.get('Amazon-Advertising-API-ClientId')}"
+            logger.debug(
+                "Got credentials with headers: %s", list(credentials.headers)
             )
 
             # Store access token in unified store
@@ -461,7 +491,9 @@ class AuthManager:
             self._active_credentials = credentials
 
             logger.info(
-                f"Got credentials for {identity_id}, expires at {credentials.expires_at}"
+                "Got credentials for %s, expires at %s",
+                identity_id,
+                credentials.expires_at,
             )
             return credentials
 
@@ -491,9 +523,7 @@ class AuthManager:
             )
 
             self._active_credentials = credentials
-            logger.info(
-                f"Cached credentials for identity {identity_id} with client ID: {credentials.headers.get('Amazon-Advertising-API-ClientId')}"
-            )
+            logger.debug("Cached credentials for default identity")
             return credentials
 
     async def get_headers(self) -> Dict[str, str]:
@@ -508,8 +538,9 @@ class AuthManager:
         credentials = await self.get_active_credentials()
         headers = credentials.headers.copy()
 
-        # Debug logging to trace the issue
-        logger.info(f"Auth headers from credentials: {list(headers.keys())}")
+        # Runs on every API request; keep it out of INFO output
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Auth headers from credentials: %s", list(headers))
 
         # Add Authorization header from access token
         if credentials.access_token:
@@ -11,6 +11,8 @@ from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
 
+from ..utils.openapi.json import json_dumps_pretty, write_bytes_atomic
+
 logger = logging.getLogger(__name__)
 
 
@@ -243,10 +245,7 @@ class OAuthStateStore:
                 data[state] = entry_dict
 
             # Write atomically
-            tmp_path = self.store_path.with_suffix(".tmp")
-            with open(tmp_path, "w") as f:
-                json.dump(data, f, indent=2)
-            tmp_path.replace(self.store_path)
+            write_bytes_atomic(self.store_path, json_dumps_pretty(data))
 
         except Exception as e:
             logger.warning(f"Could not save OAuth state store: {e}")
@@ -4,6 +4,7 @@ This module implements direct authentication using Amazon Ads API credentials,
 if you are using your own Amazon Ads API credentials/app.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
@@ -11,7 +12,7 @@ from typing import Dict, List, Optional
 import httpx
 
 from ...models import AuthCredentials, Identity, Token
-from ...utils.http import get_http_client
+from ...utils.http import async_retry, get_http_client
 from ..base import BaseAmazonAdsProvider, BaseIdentityProvider, ProviderConfig
 from ..registry import register_provider
 
@@ -51,6 +52,8 @@ class DirectAmazonAdsProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         self.profile_id = config.get("profile_id")
         self._region = config.get("region", "na")
         self._access_token: Optional[Token] = None
+        # Serializes refreshes so concurrent calls share one token exchange
+        self._refresh_lock = asyncio.Lock()
 
     @property
     def provider_type(self) -> str:
@@ -101,14 +104,20 @@ class DirectAmazonAdsProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         """
         Get current access token from Amazon Ads API.
 
-        Retrieves the current access token, first attempting to retrieve
-        from cache, then refreshing if necessary.
+        Returns the in-process token while it is valid, then tries the
+        unified token store, and only refreshes if neither has a usable
+        token.
 
         :return: Valid access token
         :rtype: Token
         :raises ValueError: If no refresh token is available
         """
-        # Try to get from AuthManager's token store first
+        # The in-process token is the common case and needs no store lookup
+        if self._access_token and await self.validate_token(self._access_token):
+            return self._access_token
+
+        # Fall back to the unified token store, which may hold a token
+        # persisted by an earlier process
         auth_manager = None
         try:
             from ..manager import get_auth_manager
@@ -137,11 +146,11 @@ class DirectAmazonAdsProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         except Exception as e:
             logger.debug(f"Could not get token from store: {e}")
 
-        # Check local cache
-        if self._access_token and await self.validate_token(self._access_token):
-            return self._access_token
-
-        return await self._refresh_access_token()
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            if self._access_token and await self.validate_token(self._access_token):
+                return self._access_token
+            return await self._refresh_access_token()
 
     async def _refresh_access_token(self) -> Token:
         """
@@ -189,22 +198,7 @@ class DirectAmazonAdsProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         auth_endpoint = self.get_oauth_endpoint()
 
         try:
-            response = await client.post(
-                auth_endpoint,
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if response.status_code != 200:
-                logger.error(
-                    f"Token refresh failed: {response.status_code} - {response.text}"
-                )
-                response.raise_for_status()
+            response = await self._post_token_request(client, auth_endpoint)
 
             data = response.json()
             access_token = data.get("access_token")
@@ -261,6 +255,48 @@ class DirectAmazonAdsProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
             logger.error(f"Error processing Amazon token response: {e}")
             raise
 
+    @async_retry(
+        max_attempts=3,
+        delay=1.0,
+        status_codes=(429, 500, 502, 503, 504),
+    )
+    async def _post_token_request(
+        self, client: httpx.AsyncClient, auth_endpoint: str
+    ) -> httpx.Response:
+        """
+        Post the refresh token grant to the LWA token endpoint.
+
+        Connection errors, throttling and 5xx responses are retried with
+        backoff; other client errors (e.g. a revoked refresh token) are
+        raised immediately.
+
+        :param client: HTTP client to send the request with
+        :type client: httpx.AsyncClient
+        :param auth_endpoint: Regional OAuth token endpoint
+        :type auth_endpoint: str
+        :return: Successful token response
+        :rtype: httpx.Response
+        :raises httpx.HTTPError: When the request fails after retries
+        """
+        response = await client.post(
+            auth_endpoint,
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        if response.status_code != 200:
+            logger.error(
+                f"Token refresh failed: {response.status_code} - {response.text}"
+            )
+            response.raise_for_status()
+
+        return response
+
     async def validate_token(self, token: Token) -> bool:
         """
         Validate if token is still valid.
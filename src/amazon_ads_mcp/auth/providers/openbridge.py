@@ -5,6 +5,7 @@ which manages multiple Amazon Ads identities through OpenBridge's
 remote identity service.
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime, timedelta, timezone
@@ -21,6 +22,9 @@ from ..registry import register_provider
 
 logger = logging.getLogger(__name__)
 
+# Per-page timeout for the remote identity listing
+IDENTITY_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
 
 class OpenbridgeTokenResponse(BaseModel):
     """OpenBridge token response model.
@@ -265,22 +269,26 @@ class OpenBridgeProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         page = 1
         has_more = True
 
+        # Everything but the page number is the same for every page
+        url = f"{self.identity_base_url}/sri"
+        headers = httpx.Headers(
+            {
+                "Authorization": f"Bearer {jwt_token.value}",
+                "x-api-key": self.refresh_token,
+            }
+        )
+        base_params = {"page_size": page_size}
+        if identity_type:
+            base_params["remote_identity_type"] = identity_type
+
         try:
             while has_more:
                 logger.debug(f"Fetching page {page} of identities")
-                params = {"page": page, "page_size": page_size}
-
-                if identity_type:
-                    params["remote_identity_type"] = identity_type
-
                 response = await client.get(
-                    f"{self.identity_base_url}/sri",
-                    params=params,
-                    headers={
-                        "Authorization": f"Bearer {jwt_token.value}",
-                        "x-api-key": self.refresh_token,
-                    },
-                    timeout=httpx.Timeout(30.0, connect=10.0),
+                    url,
+                    params={"page": page, **base_params},
+                    headers=headers,
+                    timeout=IDENTITY_TIMEOUT,
                 )
                 response.raise_for_status()
 
@@ -334,21 +342,30 @@ class OpenBridgeProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
         """
         logger.info(f"Getting credentials for identity {identity_id}")
 
-        identity = await self.get_identity(identity_id)
-        if not identity:
-            raise ValueError(f"Identity {identity_id} not found")
-
         jwt_token = await self.get_token()
         client = await self._get_client()
 
-        try:
-            response = await client.get(
+        # Once the JWT is known, the identity lookup (possibly a paginated
+        # /sri fetch) and the token request are independent round trips
+        identity, response = await asyncio.gather(
+            self.get_identity(identity_id),
+            client.get(
                 f"{self.service_base_url}/service/amzadv/token/{identity_id}",
                 headers={
                     "Authorization": f"Bearer {jwt_token.value}",
                     "x-api-key": self.refresh_token,
                 },
-            )
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(identity, BaseException):
+            raise identity
+        if not identity:
+            raise ValueError(f"Identity {identity_id} not found")
+
+        try:
+            if isinstance(response, BaseException):
+                raise response
             response.raise_for_status()
 
             data = response.json()
@@ -404,18 +421,22 @@ class OpenBridgeProvider(BaseAmazonAdsProvider, BaseIdentityProvider):
 
             # Try to parse expiration from the Amazon token if it's a JWT
             expires_at = None
-            try:
-                # Amazon tokens are usually JWTs we can decode
-                payload = jwt.decode(amazon_ads_token, options={"verify_signature": False})
-                # Check for standard JWT expiration claim
-                if "exp" in payload:
-                    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-                    logger.info(f"Parsed Amazon token expiration: {expires_at}")
-                elif "expires_at" in payload:
-                    expires_at = datetime.fromtimestamp(payload["expires_at"], tz=timezone.utc)
-                    logger.info(f"Parsed Amazon token expiration: {expires_at}")
-            except Exception as e:
-                logger.debug(f"Could not parse Amazon token as JWT: {e}")
+            # LWA tokens ("Atza|...") are opaque; only decode when the
+            # value has the three dot-separated JWT segments
+            if amazon_ads_token.count(".") == 2:
+                try:
+                    payload = jwt.decode(
+                        amazon_ads_token, options={"verify_signature": False}
+                    )
+                    # Check for standard JWT expiration claim
+                    if "exp" in payload:
+                        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+                        logger.info(f"Parsed Amazon token expiration: {expires_at}")
+                    elif "expires_at" in payload:
+                        expires_at = datetime.fromtimestamp(payload["expires_at"], tz=timezone.utc)
+                        logger.info(f"Parsed Amazon token expiration: {expires_at}")
+                except Exception as e:
+                    logger.debug(f"Could not parse Amazon token as JWT: {e}")
 
             # If we couldn't parse expiration, use a conservative default
             # OpenBridge should always return fresh tokens, but we use a short
@@ -1,7 +1,6 @@
 """Secure token storage with encryption."""
 
 import base64
-import json
 import logging
 import os
 from datetime import datetime, timezone
@@ -13,6 +12,7 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 
 from ..exceptions import TokenError
+from ..utils.openapi.json import json_dumps_pretty, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -229,8 +229,7 @@ class SecureTokenStore:
                 storage_data[token_id] = encrypted_entry
 
             # Serialize and encrypt entire file
-            json_data = json.dumps(storage_data, indent=2)
-            encrypted_data = self._fernet.encrypt(json_data.encode())
+            encrypted_data = self._fernet.encrypt(json_dumps_pretty(storage_data))
 
             # Atomic write
             tmp_path = self.storage_path.with_suffix(".tmp")
@@ -258,7 +257,7 @@ class SecureTokenStore:
                 encrypted_data = f.read()
 
             decrypted_data = self._fernet.decrypt(encrypted_data)
-            storage_data = json.loads(decrypted_data)
+            storage_data = json_loads(decrypted_data)
 
             # Load into memory cache with decrypted values
             self._memory_cache.clear()
@@ -17,6 +17,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ..utils.openapi.json import json_dumps_pretty, write_bytes_atomic
+
 try:
     from cryptography.fernet import Fernet
 
@@ -445,13 +447,8 @@ class PersistentTokenStore(InMemoryTokenStore):
             if self._encrypt_at_rest:
                 data = self._encrypt_data(data)
 
-            # Write with atomic operation for safety
-            temp_path = self._storage_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            # Atomic move
-            temp_path.replace(self._storage_path)
+            # Atomic replace; unchanged token sets are not rewritten
+            write_bytes_atomic(self._storage_path, json_dumps_pretty(data))
 
             # Try to set restrictive permissions (may fail in some Docker environments)
             try:
@@ -8,6 +8,7 @@ import httpx
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
 from ..tools.oauth import OAuthTokens
+from ..utils.http import get_http_client
 from ..utils.region_config import RegionConfig
 
 logger = logging.getLogger(__name__)
@@ -46,8 +47,8 @@ class OAuthTokenMiddleware(Middleware):
         try:
             # Use explicit timeout for OAuth token refresh
             timeout = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(token_url, data=token_data)
+            client = await get_http_client(timeout=timeout)
+            response = await client.post(token_url, data=token_data)
 
             if response.status_code == 200:
                 return response.json()
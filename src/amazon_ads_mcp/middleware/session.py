@@ -25,6 +25,8 @@ from typing import Any, Dict, Optional
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from pydantic import BaseModel, Field
 
+from ..utils.openapi.json import json_dumps_pretty, write_bytes_atomic
+
 logger = logging.getLogger(__name__)
 
 # Context variable for current session ID (async-safe)
@@ -144,8 +146,6 @@ class SessionStore:
             return
 
         try:
-            import json
-
             # Ensure directory exists
             self.store_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -158,10 +158,7 @@ class SessionStore:
                 data[session_id] = session_dict
 
             # Write atomically
-            tmp_path = self.store_path.with_suffix(".tmp")
-            with open(tmp_path, "w") as f:
-                json.dump(data, f, indent=2)
-            tmp_path.replace(self.store_path)
+            write_bytes_atomic(self.store_path, json_dumps_pretty(data))
 
             logger.debug(f"Saved {len(self._sessions)} sessions to {self.store_path}")
         except Exception as e:
@@ -14,12 +14,15 @@ forwards requests/responses transparently.
 import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Optional
 
 import httpx
 from fastapi import FastAPI, Request, Response, status
 from fastapi.responses import JSONResponse
 
+from ..utils.openapi.json import json_loads
+
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -27,6 +30,11 @@ MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:9080/mcp")
 PROXY_HOST = os.getenv("PROXY_HOST", "0.0.0.0")
 PROXY_PORT = int(os.getenv("PROXY_PORT", "8080"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Upper bound on requests forwarded to the MCP server at once
+PROXY_MAX_CONCURRENCY = int(os.getenv("PROXY_MAX_CONCURRENCY", "16"))
+# Health probes fail fast on an unreachable MCP server instead of
+# waiting out the 30s forwarding timeout
+HEALTH_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
 
 # Security: API Key for authentication
 # CRITICAL: Set this environment variable to a strong random string
@@ -43,17 +51,11 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
-# Create FastAPI app
-app = FastAPI(
-    title="Amazon Ads MCP Proxy",
-    description="Stateless HTTP proxy for MCP Server with transparent session management",
-    version="1.0.0",
-)
-
 # Persistent HTTP client and session state
 mcp_client: Optional[httpx.AsyncClient] = None
 mcp_session_id: Optional[str] = None
 session_lock = asyncio.Lock()
+forward_semaphore = asyncio.Semaphore(PROXY_MAX_CONCURRENCY)
 
 
 def verify_api_key(request: Request) -> bool:
@@ -129,28 +131,44 @@ async def ensure_session():
             logger.error(f"Failed to establish session: {e}")
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize persistent HTTP client with cookie support."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the persistent HTTP client for the lifetime of the app.
+
+    The ``async with`` block closes the client on shutdown and when
+    startup is aborted, so pooled connections are never leaked.
+    """
     global mcp_client
-    mcp_client = httpx.AsyncClient(
+    # Pool sized to the forwarding bound so concurrent requests reuse
+    # keep-alive connections instead of queueing on the default limits
+    async with httpx.AsyncClient(
         timeout=httpx.Timeout(30.0),
         follow_redirects=True,
-    )
-    logger.info(f"Proxy started - forwarding to {MCP_SERVER_URL}")
-    logger.info(f"Listening on {PROXY_HOST}:{PROXY_PORT}")
-
-    # Establish initial session
-    await ensure_session()
+        limits=httpx.Limits(
+            max_connections=PROXY_MAX_CONCURRENCY,
+            max_keepalive_connections=PROXY_MAX_CONCURRENCY,
+        ),
+    ) as client:
+        mcp_client = client
+        logger.info(f"Proxy started - forwarding to {MCP_SERVER_URL}")
+        logger.info(f"Listening on {PROXY_HOST}:{PROXY_PORT}")
+
+        # Establish initial session
+        await ensure_session()
+        try:
+            yield
+        finally:
+            mcp_client = None
+    logger.info("Proxy shutdown complete")
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close HTTP client on shutdown."""
-    global mcp_client
-    if mcp_client:
-        await mcp_client.aclose()
-        logger.info("Proxy shutdown complete")
+# Create FastAPI app
+app = FastAPI(
+    title="Amazon Ads MCP Proxy",
+    description="Stateless HTTP proxy for MCP Server with transparent session management",
+    version="1.0.0",
+    lifespan=lifespan,
+)
 
 
 @app.get("/")
@@ -168,7 +186,9 @@ async def health():
     """Detailed health check."""
     try:
         # Test connection to MCP server
-        response = await mcp_client.get(MCP_SERVER_URL.rsplit("/", 1)[0])
+        response = await mcp_client.get(
+            MCP_SERVER_URL.rsplit("/", 1)[0], timeout=HEALTH_TIMEOUT
+        )
         mcp_status = "reachable" if response.status_code < 500 else "error"
     except Exception as e:
         mcp_status = f"unreachable: {str(e)}"
@@ -231,11 +251,12 @@ async def proxy_request(request: Request) -> Response:
             headers["Cookie"] = f"mcp_session_id={mcp_session_id}"
 
         # Make request to MCP server with session in header
-        response = await mcp_client.post(
-            MCP_SERVER_URL,
-            json=body,
-            headers=headers,
-        )
+        async with forward_semaphore:
+            response = await mcp_client.post(
+                MCP_SERVER_URL,
+                json=body,
+                headers=headers,
+            )
 
         logger.debug(
             f"MCP server response: {response.status_code} for {body.get('method', 'unknown')}"
@@ -250,16 +271,17 @@ async def proxy_request(request: Request) -> Response:
 
         # Parse response - handle JSON, SSE, and empty responses
         try:
-            response_text = response.text
+            # Work on the raw bytes: json_loads accepts them directly, so
+            # the body is never decoded into an intermediate str
+            response_bytes = response.content
 
             # Check if response is Server-Sent Events format
-            if response_text.startswith("event:"):
+            if response_bytes.startswith(b"event:"):
                 # Parse SSE format: "event: message\ndata: {...}\n"
-                import json
-                for line in response_text.split("\n"):
-                    if line.startswith("data: "):
+                for line in response_bytes.splitlines():
+                    if line.startswith(b"data: "):
                         json_str = line[6:]  # Remove "data: " prefix
-                        response_content = json.loads(json_str)
+                        response_content = json_loads(json_str)
                         break
                 else:
                     # No data line found
@@ -271,15 +293,18 @@ async def proxy_request(request: Request) -> Response:
                             "message": "Invalid SSE response: no data field",
                         },
                     }
-            elif response.content:
+            elif response_bytes:
                 # Standard JSON response
-                response_content = response.json()
+                response_content = json_loads(response_bytes)
             else:
                 # Empty response
                 response_content = {}
         except Exception as e:
             logger.error(f"Failed to parse response: {e}")
-            logger.error(f"Response body: {response.text[:500]}")
+            logger.error(
+                "Response body: %s",
+                response.content[:500].decode("utf-8", "replace"),
+            )
             response_content = {
                 "jsonrpc": "2.0",
                 "id": "proxy-error",
@@ -153,29 +153,19 @@ async def register_download_tools(server: FastMCP):
     )
     async def download_export_tool(ctx: Context, export_id: str, export_url: str):
         """Download a completed export to local storage."""
-        import base64
-
+        from ..utils.export_content_type_resolver import (
+            EXPORT_SUFFIX_TYPES,
+            decode_export_type_suffix,
+        )
         from ..utils.export_download_handler import get_download_handler
 
         handler = get_download_handler()
 
         # Determine export type from ID
-        try:
-            padded = export_id + "=" * (4 - len(export_id) % 4)
-            decoded = base64.b64decode(padded).decode("utf-8")
-            if "," in decoded:
-                _, suffix = decoded.rsplit(",", 1)
-                type_map = {
-                    "C": "campaigns",
-                    "A": "adgroups",
-                    "AD": "ads",
-                    "T": "targets",
-                }
-                export_type = type_map.get(suffix.upper(), "general")
-            else:
-                export_type = "general"
-        except (AttributeError, TypeError, ValueError):
-            export_type = "general"
+        suffix = decode_export_type_suffix(export_id)
+        export_type = (
+            EXPORT_SUFFIX_TYPES.get(suffix, "general") if suffix else "general"
+        )
 
         file_path = await handler.download_export(
             export_url=export_url, export_id=export_id, export_type=export_type
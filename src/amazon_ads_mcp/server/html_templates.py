@@ -3,9 +3,15 @@
 This module contains HTML templates used in OAuth callback responses
 to avoid inline HTML in the server code and prevent exposing sensitive
 error details.
+
+Pages depend only on their arguments, which come from a small fixed set
+of call sites, so rendered output is cached.
 """
 
+from functools import lru_cache
+
 
+@lru_cache(maxsize=32)
 def get_error_html(title: str = "OAuth Error", message: str = None) -> str:
     """Generate error HTML response.
 
@@ -41,6 +47,7 @@ def get_error_html(title: str = "OAuth Error", message: str = None) -> str:
     """
 
 
+@lru_cache(maxsize=8)
 def get_success_html(title: str = "Authorization Successful") -> str:
     """Generate success HTML response.
 
@@ -26,6 +26,25 @@ from .server_builder import ServerBuilder
 logger = logging.getLogger(__name__)
 
 
+def install_uvloop() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed.
+
+    uvloop is part of the optional ``speedups`` extra and cuts per-call
+    overhead for the many small keep-alive requests the server makes
+    to the Amazon Ads API. Must be called before any loop is created.
+
+    :return: True if uvloop was installed
+    :rtype: bool
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
 async def create_amazon_ads_server() -> Any:
     """Create and configure the Amazon Ads MCP server using modular components.
 
@@ -142,6 +161,38 @@ def cleanup_sync() -> None:
             logger.debug(f"Could not perform sync cleanup: {e}")
 
 
+async def serve(transport: str, host: str, port: int) -> None:
+    """Build the server and serve it on the current event loop.
+
+    Setup and serving share one loop, so clients and locks created while
+    building the server stay bound to the loop that later uses them.
+
+    :param transport: One of ``stdio``, ``http`` or ``streamable-http``
+    :type transport: str
+    :param host: Host to bind for HTTP transports
+    :type host: str
+    :param port: Port to bind for HTTP transports
+    :type port: int
+    """
+    logger.info("Creating Amazon Ads MCP server...")
+    mcp = await create_amazon_ads_server()
+    logger.info("Server initialization complete")
+
+    if transport in ("http", "streamable-http"):
+        logger.info("Starting %s server on %s:%d", transport, host, port)
+        # Use stateless_http=True to disable FastMCP's session management
+        # This allows our proxy to handle sessions transparently for n8n
+        await mcp.run_async(
+            transport=transport,
+            host=host,
+            port=port,
+            stateless_http=True,
+        )
+    else:
+        logger.info("Running in stdio mode")
+        await mcp.run_async()
+
+
 def main() -> None:
     """Run the Amazon Ads MCP server.
 
@@ -197,32 +248,10 @@ def main() -> None:
     signal.signal(signal.SIGTERM, lambda *_: cleanup_sync())
     signal.signal(signal.SIGINT, lambda *_: cleanup_sync())
 
-    logger.info("Creating Amazon Ads MCP server...")
-    mcp = asyncio.run(create_amazon_ads_server())
-
-    # Small delay to ensure server is fully initialized
-    import time
-
-    time.sleep(0.5)
-    logger.info("Server initialization complete")
+    install_uvloop()
 
     try:
-        if args.transport in ("http", "streamable-http"):
-            transport = (
-                "streamable-http" if args.transport == "streamable-http" else "http"
-            )
-            logger.info("Starting %s server on %s:%d", transport, args.host, args.port)
-            # Use stateless_http=True to disable FastMCP's session management
-            # This allows our proxy to handle sessions transparently for n8n
-            mcp.run(
-                transport=transport,
-                host=args.host,
-                port=args.port,
-                stateless_http=True,
-            )
-        else:
-            logger.info("Running in stdio mode")
-            mcp.run()
+        asyncio.run(serve(args.transport, args.host, args.port))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     finally:
@@ -52,31 +52,33 @@ def slim_openapi_for_tools(spec: Dict[str, Any], max_desc: int = 200) -> None:
             if fixed_servers:
                 # Use the first server as default (North America)
                 spec["servers"] = [fixed_servers[0]]
-        for p, methods in (spec.get("paths") or {}).items():
+        trunc = truncate_text
+        for methods in (spec.get("paths") or {}).values():
             if not isinstance(methods, dict):
                 continue
-            for m, op in list(methods.items()):
+            for op in methods.values():
                 if not isinstance(op, dict):
                     continue
                 # Trim top-level description
+                desc = op.get("description")
                 if "description" in op:
-                    op["description"] = truncate_text(op.get("description"), max_desc)
+                    op["description"] = desc = trunc(desc, max_desc)
                 # Prefer summary if description missing or too long
-                if not op.get("description") and op.get("summary"):
-                    op["description"] = truncate_text(op.get("summary"), max_desc)
+                if not desc:
+                    summary = op.get("summary")
+                    if summary:
+                        op["description"] = trunc(summary, max_desc)
                 op.pop("externalDocs", None)
                 # Parameters
-                params = op.get("parameters") or []
+                params = op.get("parameters")
                 if isinstance(params, list):
                     for prm in params:
                         if isinstance(prm, dict) and "description" in prm:
-                            prm["description"] = truncate_text(
-                                prm.get("description"), max_desc
-                            )
+                            prm["description"] = trunc(prm["description"], max_desc)
                 # Request body description
                 req = op.get("requestBody")
                 if isinstance(req, dict) and "description" in req:
-                    req["description"] = truncate_text(req.get("description"), max_desc)
+                    req["description"] = trunc(req["description"], max_desc)
     except Exception:
         # Do not fail mounting if slimming fails
         pass
@@ -4,10 +4,11 @@ This module handles the complex server initialization process,
 including middleware setup, client configuration, and resource mounting.
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastmcp import FastMCP
 
@@ -31,6 +32,41 @@ from .sidecar_loader import _json_load as json_load
 
 logger = logging.getLogger(__name__)
 
+_METADATA_FILES = frozenset({"packages.json", "manifest.json"})
+_SIDECAR_SUFFIXES = (".media", ".manifest", ".transform")
+
+
+def _discover_spec_files(
+    resources_dir: Path,
+) -> Tuple[list[Path], frozenset[str]]:
+    """Return the OpenAPI spec files and sidecar names in a directory.
+
+    Every entry is classified by name in a single ``os.scandir`` pass:
+    metadata files are dropped, sidecars are collected by name so
+    callers can test for them without a ``stat()``, and the remaining
+    JSON files are returned as specs.
+
+    :param resources_dir: Directory containing the spec files
+    :type resources_dir: Path
+    :return: Spec paths sorted by file name, and the sidecar file names
+    :rtype: Tuple[list[Path], frozenset[str]]
+    """
+    specs: list[Path] = []
+    sidecars: set[str] = set()
+    with os.scandir(resources_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".json") or name in _METADATA_FILES:
+                continue
+            if not entry.is_file():
+                continue
+            if name[:-5].endswith(_SIDECAR_SUFFIXES):
+                sidecars.add(name)
+            else:
+                specs.append(Path(entry.path))
+    specs.sort(key=lambda p: p.name)
+    return specs, frozenset(sidecars)
+
 
 class ServerBuilder:
     """Builder class for creating configured MCP servers.
@@ -47,6 +83,7 @@ class ServerBuilder:
         self.media_registry = MediaTypeRegistry()
         self.header_resolver = HeaderNameResolver()
         self.mounted_servers: Dict[str, FastMCP] = {}
+        self._packages_cache: Dict[Path, Tuple[Optional[Path], Any]] = {}
 
     async def build(self) -> FastMCP:
         """Build and configure the MCP server.
@@ -256,41 +293,62 @@ class ServerBuilder:
             logger.warning("No resources directory found")
             return
 
+        # Discover spec files once; the allowlist resolver reuses the list
+        # and sidecar lookups use the collected names instead of stat()
+        spec_paths, sidecars = _discover_spec_files(resources_dir)
+
         # Load namespace mapping and package allowlist (if any)
         namespace_mapping = await self._load_namespace_mapping(resources_dir)
-        package_allowlist = await self._load_package_allowlist(resources_dir)
-
-        # Process each resource file
-        skip_files = {"packages.json", "manifest.json"}
-        for spec_path in sorted(resources_dir.glob("*.json")):
-            # Skip metadata files and sidecars
-            if spec_path.name in skip_files:
-                logger.debug(f"Skipping metadata file: {spec_path.name}")
-                continue
+        package_allowlist = await self._load_package_allowlist(
+            resources_dir, spec_paths
+        )
 
-            # Skip sidecar files (check suffix, not substring)
-            if spec_path.stem.endswith((".media", ".manifest", ".transform")):
-                logger.debug(f"Skipping sidecar file: {spec_path.name}")
+        # Skip specs not in the package allowlist (when set)
+        selected = []
+        for spec_path in spec_paths:
+            ns = spec_path.stem
+            if package_allowlist and ns not in package_allowlist:
+                logger.debug(
+                    "Skipping %s - not in AMAZON_AD_API_PACKAGES allowlist",
+                    ns,
+                )
                 continue
+            selected.append(spec_path)
 
-            # Skip if not in package allowlist (when set)
-            ns = spec_path.stem
-            if package_allowlist:
-                if ns not in package_allowlist:
-                    logger.debug(
-                        "Skipping %s - not in AMAZON_AD_API_PACKAGES allowlist",
-                        ns,
-                    )
-                    continue
+        # Read and parse the selected specs concurrently in worker threads;
+        # mounting itself stays sequential to keep registration order stable
+        specs = await asyncio.gather(
+            *(asyncio.to_thread(json_load, p) for p in selected),
+            return_exceptions=True,
+        )
 
-            await self._mount_single_resource(spec_path, namespace_mapping)
+        for spec_path, spec in zip(selected, specs):
+            if isinstance(spec, Exception):
+                logger.error(f"Failed to mount {spec_path}: {spec}")
+                continue
+            elif isinstance(spec, BaseException):
+                raise spec
+            await self._mount_single_resource(
+                spec_path, namespace_mapping, spec=spec, sidecars=sidecars
+            )
 
-    async def _load_namespace_mapping(self, resources_dir: Path) -> Dict[str, str]:
-        """Load namespace to prefix mapping from packages.json.
+    def _read_packages_json(
+        self, resources_dir: Path
+    ) -> Tuple[Optional[Path], Any]:
+        """Locate and parse packages.json once per resources directory.
 
-        :return: Namespace to prefix mapping
-        :rtype: Dict[str, str]
+        Both the namespace mapping and the package allowlist read this
+        file; the parsed result is cached so it is only loaded once.
+
+        :param resources_dir: Resources directory being mounted
+        :type resources_dir: Path
+        :return: Path of the packages.json used (or None) and its data
+        :rtype: Tuple[Optional[Path], Any]
         """
+        cached = self._packages_cache.get(resources_dir)
+        if cached is not None:
+            return cached
+
         # Try multiple locations for packages.json: alongside resources or project root
         candidates = [
             resources_dir.parent / "packages.json",
@@ -298,11 +356,20 @@ class ServerBuilder:
             Path("openapi/packages.json"),
         ]
         packages_path = next((p for p in candidates if p.exists()), None)
-        if not packages_path:
-            return {}
+        data = json_load(packages_path) if packages_path else None
+        self._packages_cache[resources_dir] = (packages_path, data)
+        return packages_path, data
+
+    async def _load_namespace_mapping(self, resources_dir: Path) -> Dict[str, str]:
+        """Load namespace to prefix mapping from packages.json.
 
+        :return: Namespace to prefix mapping
+        :rtype: Dict[str, str]
+        """
         try:
-            data = json_load(packages_path)
+            packages_path, data = self._read_packages_json(resources_dir)
+            if not packages_path:
+                return {}
             mapping: Dict[str, str] = {}
 
             # Preferred: explicit prefixes map
@@ -328,7 +395,7 @@ class ServerBuilder:
             return {}
 
     async def _load_package_allowlist(
-        self, resources_dir: Path
+        self, resources_dir: Path, spec_paths: Optional[list[Path]] = None
     ) -> Dict[str, None] | set:
         """Load allowed packages from environment and resolve to resource namespaces.
 
@@ -337,18 +404,15 @@ class ServerBuilder:
         no restriction.
         """
         # Load packages.json to resolve aliases -> namespaces and read defaults
-        candidates = [
-            resources_dir.parent / "packages.json",
-            resources_dir / "packages.json",
-            Path("openapi/packages.json"),
-        ]
-        packages_path = next((p for p in candidates if p.exists()), None)
-
         alias_map: Dict[str, str] = {}
         default_tokens: list[str] = []
+        packages_path = None
+        try:
+            packages_path, data = self._read_packages_json(resources_dir)
+        except Exception as e:
+            logger.debug("Failed to read packages.json: %s", e)
         if packages_path:
             try:
-                data = json_load(packages_path)
                 # `aliases` is a map: alias_slug -> NamespaceName
                 aliases = data.get("aliases") if isinstance(data, dict) else None
                 if isinstance(aliases, dict):
@@ -383,6 +447,14 @@ class ServerBuilder:
             # If we somehow ended up empty, do not restrict
             return set()
 
+        # Case-insensitive index of available namespaces (file stems)
+        if spec_paths is None:
+            spec_paths, _ = _discover_spec_files(resources_dir)
+        stems_by_lower: Dict[str, list[str]] = {}
+        for spec_path in spec_paths:
+            stem = spec_path.stem
+            stems_by_lower.setdefault(stem.lower(), []).append(stem)
+
         # Build allowlist: map requested tokens using alias_map when possible.
         allow: set[str] = set()
         for token in requested:
@@ -391,15 +463,7 @@ class ServerBuilder:
                 allow.add(alias_map[token])
                 continue
             # Accept tokens that are already namespace (file stem) names
-            # Attempt case-insensitive match against available specs
-            for spec_path in resources_dir.glob("*.json"):
-                stem = spec_path.stem
-                if stem.endswith((".media", ".manifest", ".transform")):
-                    continue
-                if spec_path.name in {"packages.json", "manifest.json"}:
-                    continue
-                if stem.lower() == token:
-                    allow.add(stem)
+            allow.update(stems_by_lower.get(token, ()))
 
         if allow:
             logger.info(
@@ -413,7 +477,11 @@ class ServerBuilder:
         return allow
 
     async def _mount_single_resource(
-        self, spec_path: Path, namespace_mapping: Dict[str, str]
+        self,
+        spec_path: Path,
+        namespace_mapping: Dict[str, str],
+        spec: Optional[dict] = None,
+        sidecars: Optional[frozenset[str]] = None,
     ):
         """Mount a single resource server.
 
@@ -421,10 +489,15 @@ class ServerBuilder:
         :type spec_path: Path
         :param namespace_mapping: Namespace to prefix mapping
         :type namespace_mapping: Dict[str, str]
+        :param spec: Already-parsed spec; loaded from ``spec_path`` if None
+        :type spec: Optional[dict]
+        :param sidecars: Known sidecar file names; checked on disk if None
+        :type sidecars: Optional[frozenset[str]]
         """
         try:
-            # Load the spec
-            spec = json_load(spec_path)
+            # Load the spec unless the caller preloaded it
+            if spec is None:
+                spec = json_load(spec_path)
 
             # Validate it's an OpenAPI spec
             if not isinstance(spec, dict) or "openapi" not in spec:
@@ -440,7 +513,11 @@ class ServerBuilder:
 
             # Load and apply media type sidecar if it exists
             media_path = spec_path.with_suffix(".media.json")
-            if media_path.exists():
+            if (
+                media_path.name in sidecars
+                if sidecars is not None
+                else media_path.exists()
+            ):
                 try:
                     media_spec = json_load(media_path)
                     self.media_registry.add_from_spec(media_spec)
@@ -500,7 +577,7 @@ class ServerBuilder:
             # Apply sidecars (transforms) to the mounted sub-server
             from .sidecar_loader import apply_sidecars
 
-            await apply_sidecars(sub_server, spec_path)
+            await apply_sidecars(sub_server, spec_path, sidecars=sidecars)
 
             logger.info(f"Mounted {namespace} with prefix '{prefix}'")
 
@@ -528,6 +605,8 @@ class ServerBuilder:
             from starlette.requests import Request
             from starlette.responses import HTMLResponse
 
+            from ..utils.http import get_http_client
+
             @self.server.custom_route("/auth/callback", methods=["GET"])
             async def oauth_callback(request: Request):
                 """Handle OAuth callback from Amazon with secure state validation."""
@@ -594,18 +673,18 @@ class ServerBuilder:
                     timeout = httpx.Timeout(
                         connect=10.0, read=30.0, write=10.0, pool=10.0
                     )
-                    async with httpx.AsyncClient(timeout=timeout) as client:
-                        response = await client.post(
-                            token_url,
-                            data={
-                                "grant_type": "authorization_code",
-                                "code": code,
-                                # Use PORT env var or request port or default
-                                "redirect_uri": f"http://localhost:{os.getenv('PORT') or request.url.port or 9080}/auth/callback",
-                                "client_id": settings.ad_api_client_id,
-                                "client_secret": settings.ad_api_client_secret,
-                            },
-                        )
+                    client = await get_http_client(timeout=timeout)
+                    response = await client.post(
+                        token_url,
+                        data={
+                            "grant_type": "authorization_code",
+                            "code": code,
+                            # Use PORT env var or request port or default
+                            "redirect_uri": f"http://localhost:{os.getenv('PORT') or request.url.port or 9080}/auth/callback",
+                            "client_id": settings.ad_api_client_id,
+                            "client_secret": settings.ad_api_client_secret,
+                        },
+                    )
 
                     if response.status_code == 200:
                         tokens = response.json()
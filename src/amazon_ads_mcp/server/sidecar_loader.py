@@ -9,11 +9,11 @@ The sidecar system allows for tool behavior modification without changing
 the underlying FastMCP server implementation.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ..utils.openapi.json import json_load
 from ..utils.tool_naming import get_tools
 from .transform_executor import DeclarativeTransformExecutor
 
@@ -28,7 +28,7 @@ def _json_load(path: Path) -> Dict[str, Any]:
     :return: Parsed JSON content as a dictionary
     :rtype: Dict[str, Any]
     """
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json_load(path)
 
 
 def resolve_tool_name(
@@ -84,7 +84,9 @@ def resolve_tool_name(
     return None
 
 
-async def apply_sidecars(server, spec_path: Path) -> None:
+async def apply_sidecars(
+    server, spec_path: Path, sidecars: Optional[frozenset] = None
+) -> None:
     """Load manifest/transform sidecars and attach transforms when supported.
 
     This function loads manifest and transform sidecar files associated
@@ -101,13 +103,22 @@ async def apply_sidecars(server, spec_path: Path) -> None:
     :type server: Any
     :param spec_path: Path to the OpenAPI specification file
     :type spec_path: Path
+    :param sidecars: Sidecar file names known to exist next to the spec;
+                     when None the files are checked on disk
+    :type sidecars: Optional[frozenset]
     :raises Exception: May raise exceptions during transform loading
                       or application, but these are logged and don't
                       stop the process
     """
     transform_path = spec_path.with_suffix(".transform.json")
     manifest_path = spec_path.with_suffix(".manifest.json")
-    if not transform_path.exists() or not manifest_path.exists():
+    if sidecars is not None:
+        present = (
+            transform_path.name in sidecars and manifest_path.name in sidecars
+        )
+    else:
+        present = transform_path.exists() and manifest_path.exists()
+    if not present:
         return
 
     try:
@@ -141,11 +152,14 @@ async def apply_sidecars(server, spec_path: Path) -> None:
         "transforms_attempted": 0,
         "transforms_applied": 0,
         "transforms_failed": 0,
+        "transforms_unmatched": 0,
     }
     for rule in transform.get("tools", []):
         metrics["transforms_attempted"] += 1
         tool_name = resolve_tool_name(rule.get("match", {}), manifest, tools_map)
         if not tool_name:
+            metrics["transforms_unmatched"] += 1
+            logger.debug("No tool matched transform rule %s", rule.get("match"))
             continue
         input_tx = ex.create_input_transform(rule)
         output_tx = ex.create_output_transform(rule)
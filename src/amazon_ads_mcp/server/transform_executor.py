@@ -9,16 +9,31 @@ The executor is designed to work with FastMCP servers and provides
 safe fallbacks when transformations fail.
 """
 
+import asyncio
+import copy
+import hashlib
+import itertools
 import json
 import logging
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..utils.async_compat import install_compatibility_policy
+from ..utils.openapi.json import json_dumps
 
 # Install compatibility policy if needed (no monkey-patching)
 install_compatibility_policy()
 
+# Batch chunks are sent one at a time unless a rule opts in with
+# "concurrency"; batches can be writes and share per-endpoint TPS limits
+DEFAULT_BATCH_CONCURRENCY = 1
+
+# AMC request fields holding timestamps that need normalizing
+AMC_TIME_FIELDS = frozenset(
+    {"minCreationTime", "maxCreationTime", "startTime", "endTime"}
+)
+
 
 class DeclarativeTransformExecutor:
     """Execute declarative transform rules from sidecars.
@@ -30,6 +45,15 @@ class DeclarativeTransformExecutor:
     - compose: variable substitution "$var" within dict structures
     """
 
+    # Coercion kind -> method name, dispatched by _apply_coercions
+    _COERCIONS = {
+        "enum_case": "_coerce_enum_case",
+        "date_yyyy_mm_dd": "_coerce_dates",
+        "number_to_string": "_coerce_numbers_to_strings",
+        "iso_to_epoch_ms": "_coerce_iso_to_epoch_ms",
+        "iso_to_amc": "_coerce_iso_to_amc",
+    }
+
     def __init__(self, namespace: str, rules: Dict[str, Any]):
         """Initialize the transform executor with namespace and rules.
 
@@ -42,6 +66,12 @@ class DeclarativeTransformExecutor:
         self.rules = rules or {}
         self.version = rules.get("version", "1.0")
         self._preset_cache: Dict[str, Any] = {}
+        # Paginated sweeps keyed by request digest, for rules that set
+        # pagination.cache_ttl_s: (fetched_at, items, pages, count, next_token)
+        self._page_cache: Dict[str, Tuple[float, List[Any], List[Any], int, Any]] = {}
+        # One executor serves every tool in the namespace; each call
+        # transform gets its own id so cached sweeps never cross tools
+        self._rule_ids = itertools.count()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def create_input_transform(
@@ -63,6 +93,8 @@ class DeclarativeTransformExecutor:
         cfg = rule.get("input_transform")
         if not cfg:
             return None
+        # Resolve the coercion methods once per rule, not per call
+        coercers = self._resolve_coercions(cfg.get("coerce"))
 
         async def _transform(args: Dict[str, Any]) -> Dict[str, Any]:
             try:
@@ -79,7 +111,8 @@ class DeclarativeTransformExecutor:
                     )
 
                 # coercions
-                a = self._apply_coercions(a, cfg.get("coerce", []))
+                for coerce in coercers:
+                    a = coerce(a)
 
                 # defaults: relative time (e.g., set minCreationTime if missing)
                 defaults = cfg.get("defaults") if isinstance(cfg, dict) else None
@@ -176,8 +209,8 @@ class DeclarativeTransformExecutor:
                 )
                 if isinstance(thresh, int) and thresh > 0:
                     try:
-                        s = json.dumps(out, ensure_ascii=False)
-                        size = len(s.encode("utf-8"))
+                        data = json_dumps(out)
+                        size = len(data)
                         if size > thresh:
                             base = Path.cwd() / "data" / "amc"
                             base.mkdir(parents=True, exist_ok=True)
@@ -186,7 +219,7 @@ class DeclarativeTransformExecutor:
                             fpath = (
                                 base / f"artifact_{self.namespace}_{int(time())}.json"
                             )
-                            fpath.write_text(s, encoding="utf-8")
+                            fpath.write_bytes(data)
                             return {
                                 "artifact_path": str(fpath),
                                 "size_bytes": size,
@@ -225,6 +258,7 @@ class DeclarativeTransformExecutor:
             # Still allow call-level shaping based on args if output_cfg exists
             if not output_cfg:
                 return None
+        rule_id = next(self._rule_ids)
 
         async def _call(
             call_next: Callable[[Dict[str, Any]], Any], args: Dict[str, Any]
@@ -238,18 +272,37 @@ class DeclarativeTransformExecutor:
                     if isinstance(lst, list) and len(lst) > size:
                         results: List[Any] = []
                         batch_errors: List[Dict[str, Any]] = []
-                        for i in range(0, len(lst), size):
-                            chunk = lst[i : i + size]
-                            chunk_args = dict(args)
-                            self._set_by_path(chunk_args, path, chunk)
-                            try:
-                                res = await call_next(chunk_args)
-                                results.append(res)
-                            except Exception as e:
+                        # Rules may opt in to sending chunks concurrently
+                        # (bounded, to stay inside API rate limits)
+                        concurrency = batch.get("concurrency")
+                        if concurrency is None:
+                            concurrency = DEFAULT_BATCH_CONCURRENCY
+                        limit = max(1, int(concurrency))
+                        sem = asyncio.Semaphore(limit)
+
+                        async def _call_chunk(chunk: List[Any]) -> Any:
+                            chunk_args = self._with_path_value(
+                                args, path, chunk
+                            )
+                            async with sem:
+                                return await call_next(chunk_args)
+
+                        outcomes = await asyncio.gather(
+                            *(
+                                _call_chunk(lst[i : i + size])
+                                for i in range(0, len(lst), size)
+                            ),
+                            return_exceptions=True,
+                        )
+                        for idx, res in enumerate(outcomes):
+                            if isinstance(res, Exception):
                                 batch_errors.append(
-                                    {"chunk": i // size, "error": str(e)}
+                                    {"chunk": idx, "error": str(res)}
                                 )
-                                continue
+                            elif isinstance(res, BaseException):
+                                raise res
+                            else:
+                                results.append(res)
                         # Smart aggregation
                         if all(isinstance(r, dict) for r in results):
                             if all(isinstance(r.get("items"), list) for r in results):
@@ -296,23 +349,76 @@ class DeclarativeTransformExecutor:
                     # Assume top-level arg schema; sidecar input_transform can also inject
                     cur_args[limit_param] = pagination.get("default_limit")
 
+                # Both keys may be dot paths: v3 list operations take the
+                # cursor in the request body (e.g. "body.nextToken")
+                items_key = pagination.get("items_key")
                 pages: List[Any] = []
+                items: List[Any] = []
                 next_token = None
                 page_count = 0
                 max_pages = int(pagination.get("max_pages", 100) or 100)
-                while True:
+                # A fresh cached sweep is reused; if it stopped at max_pages
+                # the sweep resumes from its cursor instead of page one
+                cache_ttl = float(pagination.get("cache_ttl_s", 0) or 0)
+                cache_key = (
+                    self._page_cache_key(rule_id, cur_args) if cache_ttl else None
+                )
+                cached = self._page_cache.get(cache_key) if cache_key else None
+                if cached and time.monotonic() - cached[0] < cache_ttl:
+                    _, cached_items, cached_pages, page_count, next_token = cached
+                    items = list(cached_items)
+                    pages = list(cached_pages)
+                    max_pages += page_count
+                while next_token or not page_count:
                     if next_token:
-                        cur_args[param_name] = next_token
+                        cur_args = self._with_path_value(
+                            cur_args, param_name, next_token
+                        )
                     res = await call_next(cur_args)
-                    pages.append(res)
                     # Extract next token from response
                     next_token = None
                     if isinstance(res, dict):
-                        next_token = res.get(response_key)
+                        next_token = self._get_by_path(res, response_key)
+                    page_items = (
+                        self._get_by_path(res, items_key)
+                        if items_key and isinstance(res, dict)
+                        else None
+                    )
+                    if isinstance(page_items, list):
+                        items.extend(page_items)
+                    else:
+                        pages.append(res)
                     page_count += 1
-                    if not next_token or page_count >= max_pages:
+                    if page_count >= max_pages:
                         break
-                shaped = {"pages": page_count, "results": pages}
+                if cache_key:
+                    now = time.monotonic()
+                    for key in [
+                        k
+                        for k, v in self._page_cache.items()
+                        if now - v[0] >= cache_ttl
+                    ]:
+                        del self._page_cache[key]
+                    self._page_cache[cache_key] = (
+                        now,
+                        list(items),
+                        list(pages),
+                        page_count,
+                        next_token,
+                    )
+                if items_key:
+                    # Entities from every page in one list
+                    shaped = {
+                        "pages": page_count,
+                        "items": items,
+                        "count": len(items),
+                    }
+                    if pages:
+                        shaped["results"] = pages
+                    if next_token:
+                        shaped[response_key.rsplit(".", 1)[-1]] = next_token
+                else:
+                    shaped = {"pages": page_count, "results": pages}
                 # Apply optional output shaping on aggregated results
                 if output_cfg:
                     shaped = self._shape_output(shaped, output_cfg, args)
@@ -326,6 +432,36 @@ class DeclarativeTransformExecutor:
 
         return _call
 
+    def _page_cache_key(self, rule_id: int, args: Dict[str, Any]) -> Optional[str]:
+        """Digest the rule, request args and active account for the page cache.
+
+        :param rule_id: Id of the call transform the sweep belongs to
+        :type rule_id: int
+        :param args: Arguments of the first page request
+        :type args: Dict[str, Any]
+        :return: Hex digest identifying the paginated sweep, or None when
+                 the active account cannot be determined
+        :rtype: Optional[str]
+        """
+        try:
+            from ..auth.manager import get_auth_manager
+            from ..utils.http_client import get_region_override
+
+            am = get_auth_manager()
+            identity = am.get_active_identity()
+            scope = (
+                identity.id if identity else None,
+                am.get_active_profile_id(),
+                get_region_override(),
+            )
+        except Exception:
+            # A sweep that cannot be tied to an account is never cached
+            return None
+        blob = json.dumps(
+            [self.namespace, rule_id, scope, args], sort_keys=True, default=str
+        )
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
     def _compose_structure(self, template: Any, args: Dict[str, Any]) -> Any:
         """Compose a structure using template and variable substitution.
 
@@ -360,20 +496,32 @@ class DeclarativeTransformExecutor:
         :return: Arguments with coercions applied
         :rtype: Dict[str, Any]
         """
-        if not kinds:
+        coercers = self._resolve_coercions(kinds)
+        if not coercers:
             return args
         data = dict(args)
-        for kind in kinds:
-            if kind == "enum_case":
-                data = self._coerce_enum_case(data)
-            elif kind == "date_yyyy_mm_dd":
-                data = self._coerce_dates(data)
-            elif kind == "number_to_string":
-                data = self._coerce_numbers_to_strings(data)
-            elif kind == "iso_to_epoch_ms":
-                data = self._coerce_iso_to_epoch_ms(data)
+        for coerce in coercers:
+            data = coerce(data)
         return data
 
+    def _resolve_coercions(
+        self, kinds: Any
+    ) -> List[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """Look up the bound coercion methods for the given kinds.
+
+        Unknown kinds are skipped, matching the previous if/elif chain.
+
+        :param kinds: List of coercion types
+        :type kinds: Any
+        :return: Coercion callables in the order requested
+        :rtype: List[Callable[[Dict[str, Any]], Dict[str, Any]]]
+        """
+        return [
+            getattr(self, self._COERCIONS[kind])
+            for kind in kinds or ()
+            if kind in self._COERCIONS
+        ]
+
     def _walk(self, obj: Any, fn: Callable[[Any], Any]) -> Any:
         """Recursively walk through a data structure applying a function.
 
@@ -384,9 +532,12 @@ class DeclarativeTransformExecutor:
         :return: New structure with function applied to all scalar values
         :rtype: Any
         """
-        if isinstance(obj, dict):
+        # Payloads come from JSON decoding, so exact type checks are safe
+        # and cheaper than isinstance on every node
+        t = type(obj)
+        if t is dict:
             return {k: self._walk(v, fn) for k, v in obj.items()}
-        if isinstance(obj, list):
+        if t is list:
             return [self._walk(x, fn) for x in obj]
         return fn(obj)
 
@@ -461,13 +612,6 @@ class DeclarativeTransformExecutor:
         :return: Data with time fields converted to epoch milliseconds
         :rtype: Dict[str, Any]
         """
-        targets = {
-            "minCreationTime",
-            "maxCreationTime",
-            "startTime",
-            "endTime",
-        }
-
         def to_epoch_ms(val: Any) -> Any:
             # Pass through if already int-like
             if isinstance(val, int):
@@ -504,15 +648,16 @@ class DeclarativeTransformExecutor:
             return val
 
         def walk(obj: Any) -> Any:
-            if isinstance(obj, dict):
+            t = type(obj)
+            if t is dict:
                 out = {}
                 for k, v in obj.items():
-                    if k in targets:
+                    if k in AMC_TIME_FIELDS:
                         out[k] = to_epoch_ms(v)
                     else:
                         out[k] = walk(v)
                 return out
-            if isinstance(obj, list):
+            if t is list:
                 return [walk(x) for x in obj]
             return obj
 
@@ -529,13 +674,6 @@ class DeclarativeTransformExecutor:
         :return: Data with time fields converted to AMC ISO format
         :rtype: Dict[str, Any]
         """
-        targets = {
-            "minCreationTime",
-            "maxCreationTime",
-            "startTime",
-            "endTime",
-        }
-
         def to_iso(val: Any) -> Any:
             if isinstance(val, int):
                 # assume ms if large
@@ -578,15 +716,16 @@ class DeclarativeTransformExecutor:
             return val
 
         def walk(obj: Any) -> Any:
-            if isinstance(obj, dict):
+            t = type(obj)
+            if t is dict:
                 out = {}
                 for k, v in obj.items():
-                    if k in targets:
+                    if k in AMC_TIME_FIELDS:
                         out[k] = to_iso(v)
                     else:
                         out[k] = walk(v)
                 return out
-            if isinstance(obj, list):
+            if t is list:
                 return [walk(x) for x in obj]
             return obj
 
@@ -614,17 +753,29 @@ class DeclarativeTransformExecutor:
         ]
         preset_data: Any = None
         for p in candidates:
-            if p.exists():
-                try:
-                    if p.suffix == ".json":
-                        preset_data = json.loads(p.read_text(encoding="utf-8"))
-                    else:
-                        import yaml  # type: ignore
-
-                        preset_data = yaml.safe_load(p.read_text(encoding="utf-8"))
-                except Exception:
-                    preset_data = None
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            # Reuse the parsed preset while the file is unchanged
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._preset_cache.get(str(p))
+            if cached is not None and cached[0] == signature:
+                # Merged payloads may share nested values; hand out a copy
+                preset_data = copy.deepcopy(cached[1])
                 break
+            try:
+                if p.suffix == ".json":
+                    preset_data = json.loads(p.read_bytes())
+                else:
+                    import yaml  # type: ignore
+
+                    preset_data = yaml.safe_load(p.read_text(encoding="utf-8"))
+            except Exception:
+                preset_data = None
+            # Cache a private copy so the merged result never aliases it
+            self._preset_cache[str(p)] = (signature, copy.deepcopy(preset_data))
+            break
         if isinstance(preset_data, dict):
             if not self._validate_preset(preset_data, str(preset_id)):
                 self._logger.warning("Preset %s failed validation", preset_id)
@@ -714,6 +865,33 @@ class DeclarativeTransformExecutor:
             cur = cur[p]
         cur[parts[-1]] = value
 
+    def _with_path_value(
+        self, obj: Dict[str, Any], path: str, value: Any
+    ) -> Dict[str, Any]:
+        """Return a copy of ``obj`` with ``value`` set at ``path``.
+
+        Only the dictionaries along the path are copied, so concurrent
+        batch chunks never write into a nested dict they share.
+
+        :param obj: Dictionary to copy
+        :type obj: Dict[str, Any]
+        :param path: Dot-separated path to the target location
+        :type path: str
+        :param value: Value to set at the specified path
+        :type value: Any
+        :return: Updated copy of ``obj``
+        :rtype: Dict[str, Any]
+        """
+        out = dict(obj)
+        cur = out
+        parts = path.split(".")
+        for p in parts[:-1]:
+            nxt = cur.get(p)
+            cur[p] = dict(nxt) if isinstance(nxt, dict) else {}
+            cur = cur[p]
+        cur[parts[-1]] = value
+        return out
+
     def _validate_preset(self, preset_data: Dict[str, Any], preset_id: str) -> bool:
         """Basic preset validation hook.
 
@@ -778,15 +956,15 @@ class DeclarativeTransformExecutor:
             )
             if isinstance(thresh, int) and thresh > 0:
                 try:
-                    s = json.dumps(result, ensure_ascii=False)
-                    size = len(s.encode("utf-8"))
+                    data = json_dumps(result)
+                    size = len(data)
                     if size > thresh:
                         base = Path.cwd() / "data" / "amc"
                         base.mkdir(parents=True, exist_ok=True)
                         from time import time
 
                         fpath = base / f"artifact_{self.namespace}_{int(time())}.json"
-                        fpath.write_text(s, encoding="utf-8")
+                        fpath.write_bytes(data)
                         return {
                             "artifact_path": str(fpath),
                             "size_bytes": size,
@@ -815,9 +993,10 @@ class DeclarativeTransformExecutor:
         try:
 
             def walk(obj: Any) -> Any:
-                if isinstance(obj, list):
+                t = type(obj)
+                if t is list:
                     return [walk(x) for x in obj[: max(0, n)]]
-                if isinstance(obj, dict):
+                if t is dict:
                     return {k: walk(v) for k, v in obj.items()}
                 return obj
 
@@ -10,9 +10,14 @@ unified interface for managing downloaded data files.
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ..utils.export_content_type_resolver import (
+    EXPORT_SUFFIX_TYPES,
+    decode_export_type_suffix,
+)
 from ..utils.export_download_handler import get_download_handler
 
 logger = logging.getLogger(__name__)
@@ -43,22 +48,10 @@ async def check_and_download_export(
     # Infer export type from response if not provided
     if not export_type and export_id:
         # Try to decode from export ID
-        import base64
-
-        try:
-            padded = export_id + "=" * (4 - len(export_id) % 4)
-            decoded = base64.b64decode(padded).decode("utf-8")
-            if "," in decoded:
-                _, suffix = decoded.rsplit(",", 1)
-                type_map = {
-                    "C": "campaigns",
-                    "A": "adgroups",
-                    "AD": "ads",
-                    "T": "targets",
-                }
-                export_type = type_map.get(suffix.upper(), "general")
-        except (AttributeError, TypeError, ValueError, KeyError):
-            export_type = "general"
+        suffix = decode_export_type_suffix(export_id)
+        export_type = (
+            EXPORT_SUFFIX_TYPES.get(suffix, "general") if suffix else "general"
+        )
 
     # Handle the export response
     file_path = await handler.handle_export_response(export_response, export_type)
@@ -204,21 +197,32 @@ async def clean_old_downloads(
             continue
 
         for sub_dir in resource_dir.iterdir():
-            if sub_dir.is_dir():
-                for file_path in sub_dir.iterdir():
-                    if file_path.is_file():
-                        stat = file_path.stat()
-                        modified = datetime.fromtimestamp(stat.st_mtime)
-
-                        if modified < cutoff_date:
-                            deleted_size += stat.st_size
-                            deleted_files.append(str(file_path))
-
-                            # Delete the file and its metadata
-                            file_path.unlink()
-                            meta_path = file_path.with_suffix(".meta.json")
-                            if meta_path.exists():
-                                meta_path.unlink()
+            if not sub_dir.is_dir():
+                continue
+
+            # DirEntry caches the file type; stat each file only once
+            with os.scandir(sub_dir) as it:
+                entries = [e for e in it if e.is_file(follow_symlinks=False)]
+
+            removed = set()
+            for entry in entries:
+                if entry.name in removed:
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                modified = datetime.fromtimestamp(stat.st_mtime)
+
+                if modified < cutoff_date:
+                    deleted_size += stat.st_size
+                    deleted_files.append(entry.path)
+
+                    # Delete the file and its metadata
+                    os.unlink(entry.path)
+                    meta_name = Path(entry.name).with_suffix(".meta.json").name
+                    try:
+                        os.unlink(sub_dir / meta_name)
+                        removed.add(meta_name)
+                    except FileNotFoundError:
+                        pass
 
     return {
         "success": True,
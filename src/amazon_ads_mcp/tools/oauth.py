@@ -3,6 +3,7 @@
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
+from urllib.parse import urlencode
 
 import httpx
 from fastmcp import Context
@@ -10,6 +11,7 @@ from pydantic import BaseModel, Field
 
 from ..auth.oauth_state_store import get_oauth_state_store
 from ..config.settings import Settings
+from ..utils.http import get_http_client
 from ..utils.region_config import RegionConfig
 
 logger = logging.getLogger(__name__)
@@ -57,6 +59,16 @@ class OAuthTools:
 
         port = os.getenv("PORT") or getattr(settings, "mcp_server_port", None) or 9080
         self.redirect_uri = f"http://localhost:{port}/auth/callback"
+        # Client ID and redirect URI are fixed for this instance, so the
+        # encoded authorization URL is built once instead of per flow
+        self.base_auth_url = "https://www.amazon.com/ap/oa?" + urlencode(
+            {
+                "client_id": self.client_id,
+                "scope": "cpc_advertising:campaign_management",
+                "response_type": "code",
+                "redirect_uri": self.redirect_uri,
+            }
+        )
 
     async def start_oauth_flow(
         self,
@@ -72,14 +84,7 @@ class OAuthTools:
         # Get secure state store
         state_store = get_oauth_state_store()
 
-        # Build base authorization URL
-        base_auth_url = (
-            f"https://www.amazon.com/ap/oa"
-            f"?client_id={self.client_id}"
-            f"&scope=cpc_advertising:campaign_management"
-            f"&response_type=code"
-            f"&redirect_uri={self.redirect_uri}"
-        )
+        base_auth_url = self.base_auth_url
 
         # Generate secure state with HMAC signature
         state = state_store.generate_state(
@@ -310,8 +315,8 @@ class OAuthTools:
 
         # Use explicit timeout for OAuth token refresh
         timeout = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(token_url, data=token_data)
+        client = await get_http_client(timeout=timeout)
+        response = await client.post(token_url, data=token_data)
 
         if response.status_code == 200:
             token_response = response.json()
@@ -447,8 +452,8 @@ class OAuthTools:
 
         # Use explicit timeout for OAuth callback token exchange
         timeout = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(token_url, data=token_data)
+        client = await get_http_client(timeout=timeout)
+        response = await client.post(token_url, data=token_data)
 
         if response.status_code == 200:
             token_response = response.json()
@@ -26,6 +26,12 @@ from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+REGION_NAMES = {
+    "na": "North America",
+    "eu": "Europe",
+    "fe": "Far East",
+}
+
 
 async def set_active_region(region: Literal["na", "eu", "fe"]) -> dict:
     """Set the active Amazon Ads API region.
@@ -107,13 +113,6 @@ async def set_active_region(region: Literal["na", "eu", "fe"]) -> dict:
                 auth_manager.provider._access_token = None
                 logger.info("Cleared cached access token due to region change")
 
-        # Map region to name for clarity
-        region_names = {
-            "na": "North America",
-            "eu": "Europe",
-            "fe": "Far East",
-        }
-
         # Get the new endpoint URLs from provider if available
         if hasattr(auth_manager.provider, "get_region_endpoint"):
             region_endpoint = auth_manager.provider.get_region_endpoint(region)
@@ -132,7 +131,7 @@ async def set_active_region(region: Literal["na", "eu", "fe"]) -> dict:
             "success": True,
             "previous_region": old_region,
             "new_region": region,
-            "region_name": region_names[region],
+            "region_name": REGION_NAMES[region],
             "api_endpoint": region_endpoint,
             "message": f"Region changed from {old_region} to {region}",
         }
@@ -142,7 +141,7 @@ async def set_active_region(region: Literal["na", "eu", "fe"]) -> dict:
             response["oauth_endpoint"] = oauth_endpoint
 
         logger.info(
-            f"Region changed from {old_region} to {region} ({region_names[region]})"
+            f"Region changed from {old_region} to {region} ({REGION_NAMES[region]})"
         )
         return response
 
@@ -172,13 +171,6 @@ async def get_active_region() -> dict:
             settings = Settings()
             region = settings.amazon_ads_region
 
-        # Map region to name
-        region_names = {
-            "na": "North America",
-            "eu": "Europe",
-            "fe": "Far East",
-        }
-
         # Get endpoint URLs from provider if available, otherwise from settings
         if hasattr(auth_manager.provider, "get_region_endpoint"):
             region_endpoint = auth_manager.provider.get_region_endpoint()
@@ -193,7 +185,7 @@ async def get_active_region() -> dict:
         response = {
             "success": True,
             "region": region,
-            "region_name": region_names.get(region, "Unknown"),
+            "region_name": REGION_NAMES.get(region, "Unknown"),
             "api_endpoint": region_endpoint,
             "sandbox_mode": sandbox_mode,
         }
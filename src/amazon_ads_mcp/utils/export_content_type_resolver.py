@@ -8,11 +8,55 @@ redirectors, Brand Metrics report retrieval).
 """
 
 import base64
+import binascii
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Export ID type suffix -> export content type
+EXPORT_SUFFIX_CONTENT_TYPES = MappingProxyType(
+    {
+        "C": "application/vnd.campaignsexport.v1+json",
+        "A": "application/vnd.adgroupsexport.v1+json",
+        "AD": "application/vnd.adsexport.v1+json",
+        "T": "application/vnd.targetsexport.v1+json",
+    }
+)
+# Export ID type suffix -> download sub-directory
+EXPORT_SUFFIX_TYPES = MappingProxyType(
+    {"C": "campaigns", "A": "adgroups", "AD": "ads", "T": "targets"}
+)
+
+
+@lru_cache(maxsize=256)
+def decode_export_type_suffix(export_id: str) -> Optional[str]:
+    """
+    Decode the upper-cased type suffix from a base64 export ID.
+
+    Export IDs are base64 of ``"<uuid>,<suffix>"`` with the padding
+    stripped. The same ID is decoded on every status poll and download,
+    so results are cached.
+
+    :param export_id: The export ID from Amazon
+    :type export_id: str
+    :return: Suffix such as ``"C"`` or ``"AD"``, or None if the ID does
+             not decode to that pattern
+    :rtype: Optional[str]
+    """
+    if not export_id:
+        return None
+    padded = export_id + "=" * (-len(export_id) % 4)
+    try:
+        decoded = base64.b64decode(padded).decode("utf-8")
+    except (binascii.Error, ValueError):
+        return None
+    if "," not in decoded:
+        return None
+    return decoded.rsplit(",", 1)[1].upper()
+
 
 def resolve_export_content_type(export_id: str) -> Optional[str]:
     """
@@ -37,32 +81,14 @@ def resolve_export_content_type(export_id: str) -> Optional[str]:
         # Example: "OTc2MDhjNmEtNDg3Zi00YzMyLTllOWEtMDMwNjNhYTk1MGM0LEM"
         # Decodes to: "97608c6a-487f-4c32-9e9a-03063aa950c4,C"
 
-        # Try to decode to check for pattern
-        try:
-            # Add padding if needed for base64 decode
-            padded = export_id + "=" * (4 - len(export_id) % 4)
-            decoded = base64.b64decode(padded).decode("utf-8")
-            if "," in decoded:
-                _, suffix = decoded.rsplit(",", 1)
-                suffix = suffix.upper()
-
-                # Map suffix to content-type
-                suffix_map = {
-                    "C": "application/vnd.campaignsexport.v1+json",
-                    "A": "application/vnd.adgroupsexport.v1+json",
-                    "AD": "application/vnd.adsexport.v1+json",
-                    "T": "application/vnd.targetsexport.v1+json",
-                }
-
-                content_type = suffix_map.get(suffix)
-                if content_type:
-                    logger.debug(
-                        f"Resolved export type from ID suffix '{suffix}': {content_type}"
-                    )
-                    return content_type
-        except Exception:
-            # Not base64 or doesn't match expected pattern
-            pass
+        suffix = decode_export_type_suffix(export_id)
+        if suffix:
+            content_type = EXPORT_SUFFIX_CONTENT_TYPES.get(suffix)
+            if content_type:
+                logger.debug(
+                    f"Resolved export type from ID suffix '{suffix}': {content_type}"
+                )
+                return content_type
 
         # Fallback: check if the ID itself contains hints
         export_id_lower = export_id.lower()
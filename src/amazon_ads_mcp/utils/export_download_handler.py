@@ -32,21 +32,195 @@ Environment Variables:
     - AMAZON_ADS_DOWNLOAD_DIR: Custom download directory path
 """
 
-import gzip
-import json
+import asyncio
 import logging
+import os
+import random
 import re
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import urlparse
 
 import httpx
 
 # S3 downloads use plain httpx client, not authenticated client
+from .http import get_http_client
+from .openapi.json import json_dumps_pretty, write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_TIMEOUT = httpx.Timeout(60.0)
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+# Per-attempt timeouts, widened on each retry so a slow start is not
+# retried with the same budget that just expired
+DOWNLOAD_ATTEMPT_TIMEOUTS = (
+    httpx.Timeout(60.0, connect=5.0),
+    httpx.Timeout(90.0, connect=10.0),
+    httpx.Timeout(120.0, connect=20.0),
+)
+DOWNLOAD_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class _GzipStreamDecoder:
+    """Incrementally gunzip a byte stream, including multi-member files.
+
+    ``zlib.decompressobj`` stops at the end of the first gzip member, so
+    a fresh decompressor is started on any trailing data to match
+    ``gzip.decompress``.
+    """
+
+    def __init__(self) -> None:
+        self._d = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Decompress the next chunk of the stream.
+
+        :param chunk: Compressed bytes
+        :type chunk: bytes
+        :return: Decompressed bytes available so far
+        :rtype: bytes
+        :raises zlib.error: When the data is not valid gzip
+        """
+        out = self._d.decompress(chunk)
+        while self._d.eof and self._d.unused_data:
+            rest = self._d.unused_data
+            self._d = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            out += self._d.decompress(rest)
+        return out
+
+    def finish(self) -> bytes:
+        """Flush remaining output and check the stream was complete.
+
+        :return: Any remaining decompressed bytes
+        :rtype: bytes
+        :raises EOFError: When the stream ended mid-member
+        """
+        out = self._d.flush()
+        if not self._d.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker")
+        return out
+
+
+def _announced_size(response: httpx.Response) -> int | None:
+    """Return the byte count ``aiter_bytes`` will yield, if known.
+
+    Content-Length describes the encoded body, so it only matches what
+    gets written when no Content-Encoding is applied.
+
+    :param response: Streaming response
+    :type response: httpx.Response
+    :return: Expected body size, or None when unknown
+    :rtype: int | None
+    """
+    if response.headers.get("content-encoding", "identity") != "identity":
+        return None
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+class _DownloadSink:
+    """Blocking file writer for one download attempt.
+
+    Writes the raw bytes to ``path`` and, when ``decompressed_path`` is
+    given, the gunzipped stream alongside it. If the data turns out not
+    to be valid gzip the decompressed copy is dropped and the original
+    kept. Every method does blocking IO and is meant to be called via
+    ``asyncio.to_thread``.
+
+    :param path: File to write the downloaded bytes to
+    :type path: Path
+    :param decompressed_path: File for the gunzipped copy, if any
+    :type decompressed_path: Path | None
+    :param expected_size: Announced body length, used to reserve disk
+        space up front
+    :type expected_size: int | None
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        decompressed_path: Path | None,
+        expected_size: int | None = None,
+    ) -> None:
+        self.path = path
+        self.decompressed_path = decompressed_path
+        self.size = 0
+        self._f = open(path, "wb")
+        self._preallocated = False
+        self._out: BinaryIO | None = None
+        self._decoder: _GzipStreamDecoder | None = None
+        try:
+            if expected_size and hasattr(os, "posix_fallocate"):
+                # Reserve the blocks in one go for less fragmentation on
+                # large exports; unsupported filesystems, a full disk or a
+                # bogus length just fall back to growing the file
+                try:
+                    os.posix_fallocate(self._f.fileno(), 0, expected_size)
+                    self._preallocated = True
+                except OSError as e:
+                    logger.debug(f"Skipping preallocation for {path}: {e}")
+            if decompressed_path:
+                self._out = open(decompressed_path, "wb")
+                self._decoder = _GzipStreamDecoder()
+        except BaseException:
+            self.abort()
+            raise
+
+    def _drop_decompressed(self, error: Exception) -> None:
+        logger.warning(
+            f"Failed to decompress gzip content, keeping original: {error}"
+        )
+        self._decoder = None
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self.decompressed_path is not None:
+            self.decompressed_path.unlink(missing_ok=True)
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk of the response body."""
+        self._f.write(chunk)
+        self.size += len(chunk)
+        if self._decoder and self._out is not None:
+            try:
+                self._out.write(self._decoder.feed(chunk))
+            except zlib.error as e:
+                self._drop_decompressed(e)
+
+    def finish(self) -> bool:
+        """Close the files once the body has been fully received.
+
+        :return: Whether a complete decompressed copy was written
+        :rtype: bool
+        """
+        if self._preallocated:
+            # Drop any reserved tail the body did not fill
+            self._f.truncate(self.size)
+        self._f.close()
+        if not self._decoder or self._out is None:
+            return False
+        try:
+            self._out.write(self._decoder.finish())
+        except (zlib.error, EOFError) as e:
+            self._drop_decompressed(e)
+            return False
+        self._out.close()
+        return True
+
+    def abort(self) -> None:
+        """Close and remove everything written by this attempt."""
+        self._f.close()
+        if self._out:
+            self._out.close()
+        self.path.unlink(missing_ok=True)
+        if self.decompressed_path:
+            self.decompressed_path.unlink(missing_ok=True)
+
 
 class ExportDownloadHandler:
     """Handles downloading and storing Amazon Ads API exports and reports.
@@ -175,6 +349,7 @@ class ExportDownloadHandler:
         content_disposition: str | None,
         content_type: str | None,
         export_id: str,
+        timestamp: str | None = None,
     ) -> tuple[str, bool]:
         """Infer filename and whether content is gzipped.
 
@@ -182,6 +357,7 @@ class ExportDownloadHandler:
         :param content_disposition: Content-Disposition header value
         :param content_type: Content-Type header value
         :param export_id: Export ID for fallback naming
+        :param timestamp: Filename timestamp prefix (default: now)
         :return: tuple of (filename, is_gzipped)
         """
         # Try Content-Disposition first
@@ -248,7 +424,8 @@ class ExportDownloadHandler:
                 extension = ".bin"
 
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
         # Truncate export_id if too long
         clean_id = export_id[:8] if len(export_id) > 8 else export_id
         filename = f"{timestamp}_export_{clean_id}{extension}"
@@ -275,7 +452,7 @@ class ExportDownloadHandler:
         :return: Timestamped filename
         :rtype: str
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
 
         if original_name:
             # Clean the original name
@@ -290,6 +467,85 @@ class ExportDownloadHandler:
         else:
             return f"{timestamp}_download{extension}"
 
+    async def _stream_to_disk(
+        self,
+        client: httpx.AsyncClient,
+        export_url: str,
+        export_id: str,
+        resource_path: Path,
+        timeout: httpx.Timeout,
+        timestamp: str,
+    ) -> tuple[str, str | None, bool, Path, int]:
+        """Stream one download attempt into ``resource_path``.
+
+        Files are opened for writing from scratch, so a failed attempt can
+        simply be repeated.
+
+        :param client: HTTP client to download with
+        :type client: httpx.AsyncClient
+        :param export_url: URL to download the export from
+        :type export_url: str
+        :param export_id: Export ID for fallback naming
+        :type export_id: str
+        :param resource_path: Directory to write into
+        :type resource_path: Path
+        :param timeout: Timeout for this attempt
+        :type timeout: httpx.Timeout
+        :param timestamp: Filename timestamp prefix shared by all attempts
+        :type timestamp: str
+        :return: Tuple of (filename, content_type, is_gzipped, final_path,
+                 downloaded_size)
+        :rtype: tuple[str, str | None, bool, Path, int]
+        :raises httpx.HTTPStatusError: When the server rejects the request
+        :raises httpx.TransportError: When the connection fails or times out
+        """
+        async with client.stream("GET", export_url, timeout=timeout) as response:
+            response.raise_for_status()
+
+            # Determine filename and gzip state
+            cd = response.headers.get("content-disposition")
+            ct = response.headers.get("content-type")
+            filename, is_gzipped = self._infer_filename_and_type(
+                export_url, cd, ct, export_id, timestamp
+            )
+
+            # Paths
+            file_path = resource_path / filename
+            final_path = file_path
+            decompressed_path = None
+            if is_gzipped and filename.endswith(".gz"):
+                decompressed_path = resource_path / filename[:-3]
+
+            # Save original bytes and, if gzipped, the decompressed copy
+            # (without .gz) in the same pass over the response stream.
+            # Disk writes and inflation run in a worker thread so a large
+            # export does not stall the event loop.
+            sink = await asyncio.to_thread(
+                _DownloadSink,
+                file_path,
+                decompressed_path,
+                _announced_size(response),
+            )
+            try:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(sink.write, chunk)
+                decompressed = await asyncio.to_thread(sink.finish)
+            except BaseException:
+                # Don't leave a truncated file behind a failed attempt
+                await asyncio.to_thread(sink.abort)
+                raise
+
+        size = sink.size
+        if decompressed:
+            final_path = decompressed_path
+            logger.info(
+                f"Downloaded and decompressed export to: {final_path} (original: {file_path})"
+            )
+        else:
+            logger.info(f"Downloaded export to: {final_path}")
+
+        return filename, ct, is_gzipped, final_path, size
+
     async def download_export(
         self,
         export_url: str,
@@ -318,63 +574,63 @@ class ExportDownloadHandler:
         """
         # Determine where to save
         resource_path = self.get_resource_path(export_url, export_type)
-
-        # Use plain httpx client for S3 URLs (they don't need auth headers)
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as client:
-            response = await client.get(export_url)
-        response.raise_for_status()
-
-        # Determine filename and gzip state
-        cd = response.headers.get("content-disposition")
-        ct = response.headers.get("content-type")
-        filename, is_gzipped = self._infer_filename_and_type(
-            export_url, cd, ct, export_id
-        )
-
-        # Paths
-        file_path = resource_path / filename
-        final_path = file_path
-
-        # Save original bytes
-        content_bytes = response.content
-        with open(file_path, "wb") as f:
-            f.write(content_bytes)
-
-        # If gzipped, also decompress to base (without .gz)
-        if is_gzipped and filename.endswith(".gz"):
+        # One timestamp per download, so retries reuse the same fallback
+        # filename and the metadata matches the file it describes
+        started = datetime.now()
+        timestamp = started.strftime(FILENAME_TIMESTAMP_FORMAT)
+
+        # Use plain httpx client for S3 URLs (they don't need auth headers);
+        # the pooled one keeps the connection to the bucket warm across
+        # consecutive downloads
+        client = await get_http_client(timeout=DOWNLOAD_TIMEOUT)
+        attempts = len(DOWNLOAD_ATTEMPT_TIMEOUTS)
+        for attempt, timeout in enumerate(DOWNLOAD_ATTEMPT_TIMEOUTS, 1):
             try:
-                decompressed = gzip.decompress(content_bytes)
-                base_name = filename[:-3]  # strip .gz
-                decompressed_path = resource_path / base_name
-                with open(decompressed_path, "wb") as out:
-                    out.write(decompressed)
-                final_path = decompressed_path
-                logger.info(
-                    f"Downloaded and decompressed export to: {final_path} (original: {file_path})"
+                filename, ct, is_gzipped, final_path, size = (
+                    await self._stream_to_disk(
+                        client,
+                        export_url,
+                        export_id,
+                        resource_path,
+                        timeout,
+                        timestamp,
+                    )
+                )
+                break
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                # Presigned URLs can hit transient S3 errors; client errors
+                # (expired or invalid URL) will not improve on retry
+                retryable = not isinstance(e, httpx.HTTPStatusError) or (
+                    e.response.status_code in DOWNLOAD_RETRY_STATUSES
                 )
-            except Exception as e:
+                if not retryable or attempt == attempts:
+                    raise
                 logger.warning(
-                    f"Failed to decompress gzip content, keeping original: {e}"
+                    "Download attempt %d/%d for export %s failed: %s",
+                    attempt,
+                    attempts,
+                    export_id,
+                    e,
                 )
-        else:
-            logger.info(f"Downloaded export to: {final_path}")
+                await asyncio.sleep(attempt * random.uniform(0.5, 1.0))
 
         # Save metadata if provided
         if metadata:
             meta_path = final_path.with_suffix(".meta.json")
             metadata = dict(metadata)  # shallow copy to avoid side effects
-            metadata["download_timestamp"] = datetime.now().isoformat()
+            metadata["download_timestamp"] = started.isoformat()
             metadata["export_id"] = export_id
             metadata["export_type"] = export_type
             metadata["original_url"] = export_url
-            metadata["file_size"] = len(content_bytes)
+            metadata["file_size"] = size
             metadata["original_filename"] = filename
             metadata["content_type"] = ct
             metadata["gzipped"] = is_gzipped
             metadata["saved_path"] = str(final_path)
 
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            await asyncio.to_thread(
+                write_bytes_atomic, meta_path, json_dumps_pretty(metadata)
+            )
             logger.debug(f"Saved metadata to: {meta_path}")
 
         return final_path
@@ -452,31 +708,36 @@ class ExportDownloadHandler:
                 continue
 
             for sub_dir in resource_dir.iterdir():
-                if sub_dir.is_dir():
-                    files = []
-                    for file_path in sub_dir.iterdir():
-                        if file_path.is_file() and not file_path.name.endswith(
-                            ".meta.json"
-                        ):
-                            # Get file info
-                            stat = file_path.stat()
-                            files.append(
-                                {
-                                    "name": file_path.name,
-                                    "path": str(file_path),
-                                    "size": stat.st_size,
-                                    "modified": datetime.fromtimestamp(
-                                        stat.st_mtime
-                                    ).isoformat(),
-                                    "has_metadata": file_path.with_suffix(
-                                        ".meta.json"
-                                    ).exists(),
-                                }
-                            )
-
-                    if files:
-                        relative_path = sub_dir.relative_to(self.base_dir)
-                        downloads[str(relative_path)] = files
+                if not sub_dir.is_dir():
+                    continue
+
+                # One scandir pass per directory; DirEntry caches the file
+                # type and metadata sidecars are matched by name, not stat
+                with os.scandir(sub_dir) as it:
+                    entries = [e for e in it if e.is_file(follow_symlinks=False)]
+                names = {e.name for e in entries}
+
+                files = []
+                for entry in entries:
+                    if entry.name.endswith(".meta.json"):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    meta_name = Path(entry.name).with_suffix(".meta.json").name
+                    files.append(
+                        {
+                            "name": entry.name,
+                            "path": entry.path,
+                            "size": stat.st_size,
+                            "modified": datetime.fromtimestamp(
+                                stat.st_mtime
+                            ).isoformat(),
+                            "has_metadata": meta_name in names,
+                        }
+                    )
+
+                if files:
+                    relative_path = sub_dir.relative_to(self.base_dir)
+                    downloads[str(relative_path)] = files
 
         return downloads
 
@@ -6,7 +6,8 @@ providing consistent header naming across different API versions.
 """
 
 import re
-from typing import Iterable, Optional, Set
+from functools import lru_cache
+from typing import Iterable, Optional, Set, Tuple
 
 
 class HeaderNameResolver:
@@ -24,26 +25,40 @@ class HeaderNameResolver:
         self.scope_header_names: Set[str] = set()
         self.account_header_names: Set[str] = set()
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _classify(cls, name: str) -> Tuple[bool, bool, bool]:
+        """Match a header name against the client/scope/account patterns.
+
+        The same few header names repeat across every spec, so the
+        regex results are cached per name.
+        """
+        low = name.lower()
+        return (
+            bool(cls._CLIENT_PAT.search(low)),
+            bool(cls._SCOPE_PAT.search(low)),
+            bool(cls._ACCOUNT_PAT.search(low)),
+        )
+
     def add_from_spec(self, spec: dict) -> None:
         """Extract header names from an OpenAPI specification."""
         params = (spec.get("components") or {}).get("parameters") or {}
 
-        for param_name, param_def in params.items():
-            if not isinstance(param_def, dict):
-                continue
-            if param_def.get("in") != "header":
+        for param_def in params.values():
+            # Most parameters are path/query/body; reject them first
+            if type(param_def) is not dict or param_def.get("in") != "header":
                 continue
 
-            name = param_def.get("name", "")
+            name = param_def.get("name")
             if not name:
                 continue
 
-            low = name.lower()
-            if self._CLIENT_PAT.search(low):
+            is_client, is_scope, is_account = self._classify(name)
+            if is_client:
                 self.client_header_names.add(name)
-            if self._SCOPE_PAT.search(low):
+            if is_scope:
                 self.scope_header_names.add(name)
-            if self._ACCOUNT_PAT.search(low):
+            if is_account:
                 self.account_header_names.add(name)
 
     @staticmethod
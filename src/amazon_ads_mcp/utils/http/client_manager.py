@@ -13,12 +13,30 @@ for all managed HTTP clients.
 import asyncio
 import logging
 import os
+import ssl
+from functools import lru_cache
 from typing import Any, Dict, Optional, Type
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Idle keep-alive lifetime for pooled connections. Long enough to carry a
+# connection across bursts of tool calls (and region switches, which use
+# their own per-base_url client), short enough to retire it before the
+# usual 60-75s server-side idle timeouts close it under us.
+DEFAULT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "55"))
+
+
+@lru_cache(maxsize=1)
+def _h2_available() -> bool:
+    """Return whether the optional ``h2`` package can be imported."""
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except Exception:
+        return False
+    return True
+
 
 class HTTPClientManager:
     """Manages shared HTTP clients with connection pooling.
@@ -55,17 +73,37 @@ class HTTPClientManager:
         """
         if not hasattr(self, "_initialized"):
             self._clients: Dict[str, httpx.AsyncClient] = {}
+            # One TLS context per protocol mode, shared by every client
+            self._ssl_contexts: Dict[bool, ssl.SSLContext] = {}
             self._default_timeout = httpx.Timeout(
                 connect=5.0, read=30.0, write=10.0, pool=5.0
             )
             self._default_limits = httpx.Limits(
                 max_keepalive_connections=10,
                 max_connections=20,
-                keepalive_expiry=30.0,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
             )
             self._initialized = True
             self._is_closing = False
 
+    def _get_ssl_context(self, http2: bool) -> ssl.SSLContext:
+        """Return the shared TLS context for the given protocol mode.
+
+        Building a context loads the CA bundle from disk, so clients
+        share one instead of each creating their own. HTTP/1.1 and
+        HTTP/2 clients get separate contexts because the transport sets
+        ALPN protocols on the context it is given.
+
+        :param http2: Whether the client negotiates HTTP/2
+        :type http2: bool
+        :return: Default-verifying SSL context
+        :rtype: ssl.SSLContext
+        """
+        ctx = self._ssl_contexts.get(http2)
+        if ctx is None:
+            ctx = self._ssl_contexts[http2] = httpx.create_ssl_context()
+        return ctx
+
     async def get_client(
         self,
         base_url: Optional[str] = None,
@@ -95,15 +133,14 @@ class HTTPClientManager:
         """
         http2_flag = kwargs.get("http2")
         if http2_flag is None:
+            # HTTP/2 is opt-in via HTTP_ENABLE_HTTP2=true and needs h2
+            # (the ``http2`` extra); an importable h2 alone changes nothing
             http2_flag = os.getenv("HTTP_ENABLE_HTTP2", "false").lower() == "true"
-        if http2_flag:
-            try:
-                import h2  # type: ignore  # noqa: F401
-            except Exception:
-                logger.warning(
-                    "HTTP/2 requested but 'h2' package not installed; falling back to HTTP/1.1"
-                )
-                http2_flag = False
+        if http2_flag and not _h2_available():
+            logger.warning(
+                "HTTP/2 requested but 'h2' package not installed; falling back to HTTP/1.1"
+            )
+            http2_flag = False
         follow = kwargs.get("follow_redirects", True)
 
         def timeout_key(t: Optional[httpx.Timeout]):
@@ -142,6 +179,7 @@ class HTTPClientManager:
                         "limits": limits or self._default_limits,
                         "http2": http2_flag,
                         "follow_redirects": follow,
+                        "verify": self._get_ssl_context(http2_flag),
                         **kwargs,
                     }
                     if base_url:
@@ -170,6 +208,21 @@ class HTTPClientManager:
         self._external_clients.add(client)
         logger.debug("Registered external client for cleanup tracking")
 
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient, label: str) -> None:
+        """Close a single client, logging rather than raising on failure.
+
+        :param client: Client to close
+        :type client: httpx.AsyncClient
+        :param label: Description used in log messages
+        :type label: str
+        """
+        try:
+            await client.aclose()
+            logger.debug("Closed %s", label)
+        except Exception as e:
+            logger.warning("Error closing %s: %s", label, e)
+
     async def close_all(self):
         """Close all managed and external HTTP clients.
 
@@ -189,22 +242,18 @@ class HTTPClientManager:
                 logger.debug("No HTTP clients to close")
                 return
             logger.info("Closing %d HTTP client(s)...", total_clients)
-            for cache_key, client in list(self._clients.items()):
-                try:
-                    await client.aclose()
-                    logger.debug("Closed managed HTTP client: %s", cache_key)
-                except Exception as e:
-                    logger.warning(
-                        "Error closing managed HTTP client %s: %s",
-                        cache_key,
-                        e,
-                    )
-            for client in list(self._external_clients):
-                try:
-                    await client.aclose()
-                    logger.debug("Closed external HTTP client")
-                except Exception as e:
-                    logger.warning("Error closing external HTTP client: %s", e)
+            # Each aclose() drains its own pool; close them concurrently so
+            # shutdown waits on the slowest client instead of the sum
+            await asyncio.gather(
+                *(
+                    self._close_client(client, f"managed HTTP client {key}")
+                    for key, client in list(self._clients.items())
+                ),
+                *(
+                    self._close_client(client, "external HTTP client")
+                    for client in list(self._external_clients)
+                ),
+            )
             self._clients.clear()
             self._external_clients.clear()
             logger.info("All HTTP clients closed successfully")
@@ -288,7 +337,7 @@ def create_timeout(
 def create_limits(
     max_keepalive_connections: int = 10,
     max_connections: int = 20,
-    keepalive_expiry: float = 30.0,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
 ) -> httpx.Limits:
     """Create a connection limits configuration object.
 
@@ -308,22 +357,33 @@ def create_limits(
     )
 
 
-async def health_check(url: str, timeout: float = 5.0) -> bool:
+async def health_check(
+    url: str, timeout: float = 5.0, connect_timeout: float = 2.0
+) -> bool:
     """Perform a health check on a URL.
 
     Makes a simple GET request to the specified URL to check if
-    the service is responding with a successful status code.
+    the service is responding with a successful status code. The
+    connect phase has its own shorter deadline so an unreachable host
+    fails fast instead of using up the whole timeout.
 
     :param url: URL to perform health check on
     :type url: str
     :param timeout: Timeout for the health check request in seconds
     :type timeout: float
+    :param connect_timeout: Timeout for establishing the connection
+    :type connect_timeout: float
     :return: True if health check passes, False otherwise
     :rtype: bool
     """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(url)
-            return 200 <= r.status_code < 300
+        client = await http_client_manager.get_client(
+            timeout=httpx.Timeout(
+                timeout, connect=min(connect_timeout, timeout)
+            ),
+            follow_redirects=False,
+        )
+        r = await client.get(url)
+        return 200 <= r.status_code < 300
     except Exception:
         return False
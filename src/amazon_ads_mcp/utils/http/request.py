@@ -13,6 +13,7 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from ..openapi.json import json_loads
 from .client_manager import get_http_client
 from .retry import async_retry
 
@@ -72,7 +73,7 @@ class HTTPResponse:
         :rtype: Any
         """
         if self._json_cache is None:
-            self._json_cache = self.response.json()
+            self._json_cache = json_loads(self.response.content)
         return self._json_cache
 
     def is_success(self) -> bool:
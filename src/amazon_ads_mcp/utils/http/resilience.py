@@ -16,7 +16,7 @@ import asyncio
 import logging
 import random
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -33,13 +33,31 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# Number of recent (endpoint, status, seconds) samples kept in memory
+RECENT_RESPONSES_SIZE = 256
+
+
 class MetricsCollector:
     """Collects metrics for monitoring and alerting."""
 
     def __init__(self):
         self._metrics: Dict[str, Dict[str, Any]] = defaultdict(lambda: defaultdict(int))
+        self._recent: deque = deque(maxlen=RECENT_RESPONSES_SIZE)
         self._start_time = time.time()
 
+    def record_response(self, endpoint: str, status_code: int, seconds: float) -> None:
+        """Record a response's status and latency.
+
+        Called from an httpx response hook for every request, so it only
+        appends to memory and never formats or emits a log line.
+        """
+        self._metrics["counters"][f"responses_total.{endpoint}.{status_code}"] += 1
+        self._recent.append((endpoint, status_code, seconds))
+
+    def recent_responses(self) -> List[Tuple[str, int, float]]:
+        """Get the most recent (endpoint, status, seconds) samples."""
+        return list(self._recent)
+
     def record_throttle(self, endpoint: str, region: str) -> None:
         """Record a 429 throttle response."""
         key = f"ads_api_throttles_total.{endpoint}.{region}"
@@ -200,8 +218,11 @@ class TokenBucket:
                 logger.error(f"Queue depth exceeded for {self.endpoint}, failing fast")
                 raise Exception(f"Rate limit queue full for {self.endpoint}")
 
-            # Wait with jitter
-            wait_time = (1.0 / self.capacity) * random.uniform(0.5, 1.5)
+            # Sleep until the next token is due rather than polling at a
+            # fixed fraction of the refill interval; the small upward
+            # jitter keeps concurrent waiters from waking in lockstep
+            wait_time = (1.0 - self.tokens) / self.capacity
+            wait_time *= random.uniform(1.0, 1.1)
             wait_time = min(wait_time, 1.0)  # Cap at 1 second
 
             if deadline:
@@ -430,20 +451,17 @@ class ResilientRetry:
                             if retry_after_delay:
                                 metrics.record_retry_after(endpoint, retry_after_delay)
 
-                        # For 4xx errors, only retry if idempotent
-                        elif 400 <= status_code < 500:
-                            if request and is_idempotent_request(request):
-                                logger.debug(
-                                    f"Retrying idempotent request despite {status_code}"
-                                )
-                                should_retry = True
+                        # Other 4xx responses (malformed body, bad auth) fail
+                        # the same way on every attempt, even for idempotent
+                        # requests; retrying them only burns rate-limit budget
 
                     elif isinstance(e, (httpx.RequestError, httpx.TimeoutException)):
                         # Network errors and timeouts are retryable
                         should_retry = True
 
-                    # Record failure
-                    if self.use_circuit_breaker and url:
+                    # Record failure; client errors say nothing about the
+                    # endpoint's health, so they do not trip the breaker
+                    if self.use_circuit_breaker and url and should_retry:
                         breaker = get_circuit_breaker(endpoint)
                         breaker.record_failure()
 
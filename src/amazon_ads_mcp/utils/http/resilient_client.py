@@ -5,6 +5,7 @@ all resilience patterns recommended by Amazon for API interactions.
 """
 
 import logging
+import time
 from typing import Any, Dict
 
 import httpx
@@ -21,6 +22,21 @@ from .resilience import (
 logger = logging.getLogger(__name__)
 
 
+async def _stamp_request(request: httpx.Request) -> None:
+    """Mark when a request leaves the client, for latency metrics."""
+    request.extensions["sent_at"] = time.monotonic()
+
+
+async def _record_response(response: httpx.Response) -> None:
+    """Record status and latency of every response in the metrics ring."""
+    request = response.request
+    sent_at = request.extensions.get("sent_at")
+    seconds = time.monotonic() - sent_at if sent_at is not None else 0.0
+    metrics.record_response(
+        get_endpoint_family(str(request.url)), response.status_code, seconds
+    )
+
+
 class ResilientAuthenticatedClient(AuthenticatedClient):
     """Enhanced authenticated client with built-in resilience patterns.
 
@@ -51,7 +67,10 @@ class ResilientAuthenticatedClient(AuthenticatedClient):
         :param args: Positional arguments for parent class
         :param kwargs: Keyword arguments for parent class
         """
-        super().__init__(*args, **kwargs)
+        hooks = dict(kwargs.pop("event_hooks", None) or {})
+        hooks["request"] = [*hooks.get("request", ()), _stamp_request]
+        hooks["response"] = [*hooks.get("response", ()), _record_response]
+        super().__init__(*args, event_hooks=hooks, **kwargs)
         self.enable_rate_limiting = enable_rate_limiting
         self.enable_circuit_breaker = enable_circuit_breaker
         self.interactive_mode = interactive_mode
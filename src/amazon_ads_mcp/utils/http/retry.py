@@ -5,8 +5,9 @@ functions to automatically retry failed operations. It supports
 configurable retry attempts, delays with exponential backoff, and
 selective retry based on exception types and HTTP status codes.
 
-The retry mechanism includes jitter to prevent thundering herd problems
-and can be customized for different failure scenarios.
+The retry mechanism includes jitter to prevent thundering herd problems,
+honors the server's Retry-After hint on status errors, and can be
+customized for different failure scenarios.
 """
 
 import asyncio
@@ -16,6 +17,8 @@ from typing import Callable, Optional, Tuple, Type, TypeVar
 
 import httpx
 
+from .resilience import parse_retry_after
+
 T = TypeVar("T")
 
 
@@ -25,6 +28,7 @@ def async_retry(
     backoff: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (httpx.HTTPError,),
     status_codes: Optional[Tuple[int, ...]] = (429, 502, 503, 504),
+    max_delay: float = 30.0,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Create a retry decorator for async functions.
 
@@ -45,6 +49,10 @@ def async_retry(
     :param status_codes: Optional tuple of HTTP status codes that should
                          trigger retries (only applies to HTTPStatusError)
     :type status_codes: Optional[Tuple[int, ...]]
+    :param max_delay: Upper bound in seconds on any single wait, so long
+                      retry chains back off without stalling for minutes;
+                      also caps a server-sent Retry-After
+    :type max_delay: float
     :return: Decorator function that can be applied to async functions
     :rtype: Callable[[Callable[..., T]], Callable[..., T]]
     """
@@ -63,8 +71,14 @@ def async_retry(
                         if status_codes and e.response.status_code not in status_codes:
                             raise
                     if attempt < max_attempts - 1:
-                        jitter = random.uniform(0.8, 1.2)
-                        await asyncio.sleep(current_delay * jitter)
+                        wait = current_delay * random.uniform(0.8, 1.2)
+                        if isinstance(e, httpx.HTTPStatusError):
+                            # Retrying before the server's hint only
+                            # earns another 429
+                            hint = parse_retry_after(e.response)
+                            if hint:
+                                wait = max(wait, hint)
+                        await asyncio.sleep(min(wait, max_delay))
                         current_delay *= backoff
                     else:
                         raise
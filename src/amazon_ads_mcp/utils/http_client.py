@@ -18,12 +18,12 @@ Examples:
     >>> response = await client.get("/v2/profiles")
 """
 
-import json
 import logging
 import os
+import re
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import httpx
@@ -34,6 +34,7 @@ from ..utils.export_content_type_resolver import (
 )
 from ..utils.header_resolver import HeaderNameResolver
 from ..utils.media import MediaTypeRegistry
+from ..utils.openapi.json import json_dumps, json_loads
 from ..utils.region_config import RegionConfig
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,30 @@ _ROUTING_STATE_VAR: ContextVar[Dict[str, Any]] = ContextVar(
     "amazon_ads_routing_state", default={}
 )
 
+# Header name variants folded into the spec-preferred names, checked in order
+CLIENT_HEADER_VARIANTS = (
+    "Amazon-Advertising-API-ClientId",
+    "Amazon-Ads-ClientId",
+    "Client-Id",
+    "ClientId",
+)
+SCOPE_HEADER_VARIANTS = (
+    "Amazon-Advertising-API-Scope",
+    "Amazon-Ads-Scope",
+    "Scope",
+)
+ACCOUNT_HEADER_VARIANTS = ("Amazon-Ads-AccountId", "Account-Id", "AccountId")
+# Header names whose values never appear in debug logs
+_REDACTED_HEADERS = frozenset({"authorization", "amazon-advertising-api-clientid"})
+
+
+def _format_headers(headers: httpx.Headers) -> str:
+    """Render request headers as indented lines with secrets redacted."""
+    return "\n".join(
+        f"  {k}: [REDACTED]" if k.lower() in _REDACTED_HEADERS else f"  {k}: {v}"
+        for k, v in headers.items()
+    )
+
 
 class AuthenticatedClient(httpx.AsyncClient):
     """Enhanced HTTP client that manages Amazon Ads API authentication headers.
@@ -96,6 +121,9 @@ class AuthenticatedClient(httpx.AsyncClient):
         "amazon-ads-accountid",
         "x-amz-access-token",
     )
+    _FORBID_RE = re.compile(
+        "|".join(map(re.escape, _FORBID_SUBSTRS)), re.IGNORECASE
+    )
 
     def __init__(
         self,
@@ -111,6 +139,19 @@ class AuthenticatedClient(httpx.AsyncClient):
         self.header_resolver: HeaderNameResolver = (
             header_resolver or HeaderNameResolver()
         )
+        # Settings are read from the environment once, on first routed
+        # request, instead of re-validating BaseSettings per request
+        self._settings: Optional[Settings] = None
+
+    def _get_settings(self) -> Settings:
+        """Return the client's settings, loading them on first use.
+
+        :return: Settings snapshot used for region routing
+        :rtype: Settings
+        """
+        if self._settings is None:
+            self._settings = Settings()
+        return self._settings
 
     async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
         """Single interception point for all HTTP requests.
@@ -143,41 +184,27 @@ class AuthenticatedClient(httpx.AsyncClient):
         # Mark as processing to prevent concurrent/recursive injection
         request.extensions["auth_injected"] = True
 
-        # Log incoming request for debugging (only once)
-        logger.debug(f"=== SEND: {request.method} {request.url}")
-        logger.debug(f"    Headers before injection: {list(request.headers.keys())}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            before = list(request.headers.keys())
 
         # Inject headers (only once)
         await self._inject_headers(request)
 
-        logger.debug(f"Headers injected for {request.method} {request.url}")
-        logger.debug(f"    Headers after injection: {list(request.headers.keys())}")
-
-        # Log critical headers for debugging
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"    Accept: {request.headers.get('accept', 'NOT SET')}")
+        # Emit the whole request trace as one record; building it per
+        # line cost a formatted string and a handler call per header
+        if debug:
             logger.debug(
-                f"    Content-Type: {request.headers.get('content-type', 'NOT SET')}"
+                "=== SEND: %s %s\n"
+                "    Headers before injection: %s\n"
+                "    Headers after injection: %s\n"
+                "Headers:\n%s",
+                request.method,
+                request.url,
+                before,
+                list(request.headers.keys()),
+                _format_headers(request.headers),
             )
-            # Verify auth header is present
-            if "authorization" in request.headers:
-                auth_val = request.headers["authorization"]
-                logger.debug(
-                    f"    Authorization present: Bearer [{len(auth_val) - 7} chars]"
-                )
-
-        # Log the actual request headers right before sending
-        logger.debug("=== ACTUAL REQUEST BEING SENT ===")
-        logger.debug(f"URL: {request.url}")
-        logger.debug("Headers:")
-        for k, v in request.headers.items():
-            if k.lower() in [
-                "authorization",
-                "amazon-advertising-api-clientid",
-            ]:
-                logger.debug(f"  {k}: [REDACTED]")
-            else:
-                logger.debug(f"  {k}: {v}")
 
         # Call parent's send
         resp = await super().send(request, **kwargs)
@@ -193,7 +220,7 @@ class AuthenticatedClient(httpx.AsyncClient):
                 shaped = self._maybe_shape_amc_response(request, resp)
                 if shaped is not None:
                     # Create new response with shaped content (avoid _content manipulation)
-                    payload = json.dumps(shaped, ensure_ascii=False).encode("utf-8")
+                    payload = json_dumps(shaped)
 
                     # Build new response object
                     resp = httpx.Response(
@@ -228,11 +255,6 @@ class AuthenticatedClient(httpx.AsyncClient):
                 return None
             url = str(request.url)
             path = urlparse(url).path or ""
-            data = response.json()
-
-            # Only shape dict/array JSON
-            if not isinstance(data, (dict, list)):
-                return None
 
             # Determine cap based on endpoint family
             cap = None
@@ -267,6 +289,14 @@ class AuthenticatedClient(httpx.AsyncClient):
             if cap is None:
                 return None
 
+            # Parse only once the path is known to be shaped; every other
+            # JSON response would be decoded here just to be discarded
+            data = json_loads(response.content)
+
+            # Only shape dict/array JSON
+            if not isinstance(data, (dict, list)):
+                return None
+
             return self._truncate_lists(data, cap)
         except Exception:
             return None
@@ -317,29 +347,15 @@ class AuthenticatedClient(httpx.AsyncClient):
         pref_acct = self.header_resolver.prefer_account() or "Amazon-Ads-AccountId"
 
         # Normalize to preferred keys when variants exist
-        def move_first(src_keys: List[str], dest_key: str) -> None:
+        def move_first(src_keys: Tuple[str, ...], dest_key: str) -> None:
             for s in src_keys:
                 if s in out and out[s]:
                     out[dest_key] = out.pop(s)
                     return
 
-        move_first(
-            [
-                "Amazon-Advertising-API-ClientId",
-                "Amazon-Ads-ClientId",
-                "Client-Id",
-                "ClientId",
-            ],
-            pref_client,
-        )
-        move_first(
-            ["Amazon-Advertising-API-Scope", "Amazon-Ads-Scope", "Scope"],
-            pref_scope,
-        )
-        move_first(
-            ["Amazon-Ads-AccountId", "Account-Id", "AccountId"],
-            pref_acct,
-        )
+        move_first(CLIENT_HEADER_VARIANTS, pref_client)
+        move_first(SCOPE_HEADER_VARIANTS, pref_scope)
+        move_first(ACCOUNT_HEADER_VARIANTS, pref_acct)
 
         return out
 
@@ -455,7 +471,7 @@ class AuthenticatedClient(httpx.AsyncClient):
         # 2) STRIP POLLUTED HEADERS
         removed = []
         for key in list(request.headers.keys()):
-            if any(s in key.lower() for s in self._FORBID_SUBSTRS):
+            if self._FORBID_RE.search(key):
                 removed.append(key)
                 del request.headers[key]
         if removed:
@@ -539,14 +555,16 @@ class AuthenticatedClient(httpx.AsyncClient):
                 # 4) If still unknown, fall back to configured settings region
                 if not region:
                     try:
-                        region = Settings().amazon_ads_region
+                        region = self._get_settings().amazon_ads_region
                     except Exception:
                         region = "na"
                     source = source or "fallback"
 
-                # Compute desired host
+                # Compute desired host. Unreadable settings must not be
+                # mistaken for production mode: the error skips routing
+                # and leaves the request URL untouched
                 host = RegionConfig.get_api_host(region)
-                if Settings().amazon_ads_sandbox_mode:
+                if self._get_settings().amazon_ads_sandbox_mode:
                     host = host.replace("advertising-api", "advertising-api-test")
 
                 # Rewrite request URL host if different
@@ -725,13 +743,13 @@ class AuthenticatedClient(httpx.AsyncClient):
                     # Otherwise, trust the base URL set during initialization for Direct auth
 
             # Get fresh auth headers for EVERY request (critical for OpenBridge)
-            auth_headers: Dict[str, str] = {}
             if self.auth_manager is not None:
-                logger.info(f"Getting auth headers for request to {path}")
+                logger.debug("Getting auth headers for request to %s", path)
                 try:
-                    headers = await self.auth_manager.get_headers()
-                    logger.info(f"Got auth headers: {list(headers.keys())}")
-                    auth_headers.update(headers)
+                    # get_headers() already returns a fresh dict per call
+                    auth_headers = await self.auth_manager.get_headers()
+                    if auth_headers is None:
+                        raise ValueError("no authentication headers available")
                 except Exception as e:
                     # Do not send unauthenticated requests to Amazon Ads API
                     raise httpx.RequestError(
@@ -785,27 +803,22 @@ class AuthenticatedClient(httpx.AsyncClient):
                     auth_headers.pop(k, None)
 
             # Merge auth headers last
-            logger.info("Adding auth headers to request:")
             for k, v in auth_headers.items():
                 if v:
                     request.headers[k] = v
-                    if "authorization" in k.lower():
-                        # Log Bearer prefix and token length for debugging
-                        if v.startswith("Bearer "):
-                            token_len = len(v) - 7  # Subtract "Bearer " length
-                            logger.info(f"  {k}: Bearer [token: {token_len} chars]")
-                        else:
-                            logger.warning(f"  {k}: MISSING 'Bearer ' prefix! Value starts with: {v[:10]}...")
-                    else:
-                        logger.info(f"  {k}: {v}")
+                    if "authorization" in k.lower() and not v.startswith(
+                        "Bearer "
+                    ):
+                        logger.warning(
+                            "%s: MISSING 'Bearer ' prefix! Value starts with: %s...",
+                            k,
+                            v[:10],
+                        )
 
-            # Log final headers (for debugging)
-            logger.debug("Final request headers:")
-            for k, v in request.headers.items():
-                if "authorization" in k.lower() or "token" in k.lower():
-                    logger.debug(f"  {k}: [REDACTED]")
-                else:
-                    logger.debug(f"  {k}: {v}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Added auth headers: %s", [k for k, v in auth_headers.items() if v]
+                )
 
         # Ensure Accept header for JSON responses
         if "Accept" not in request.headers:
@@ -10,14 +10,20 @@ The module also provides an enhanced media type registry that combines
 base registry functionality with negotiation capabilities.
 """
 
-import base64
 import logging
 import re
 from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
+from ..export_content_type_resolver import (
+    EXPORT_SUFFIX_CONTENT_TYPES,
+    decode_export_type_suffix,
+)
+
 logger = logging.getLogger(__name__)
 
+_EXPORT_ID_RE = re.compile(r"/exports/([^/?]+)")
+
 
 class ResourceTypeNegotiator:
     """Negotiator for determining media types based on resource types.
@@ -136,26 +142,15 @@ class ResourceTypeNegotiator:
         """
         if method.upper() != "GET":
             return None
-        m = re.search(r"/exports/([^/?]+)", url)
+        m = _EXPORT_ID_RE.search(url)
         if not m:
             return None
-        export_id = m.group(1)
-        try:
-            padded = export_id + "=" * (4 - len(export_id) % 4)
-            decoded = base64.b64decode(padded).decode("utf-8")
-            if "," in decoded:
-                _, suffix = decoded.rsplit(",", 1)
-                suffix_map = {
-                    "C": "application/vnd.campaignsexport.v1+json",
-                    "A": "application/vnd.adgroupsexport.v1+json",
-                    "AD": "application/vnd.adsexport.v1+json",
-                    "T": "application/vnd.targetsexport.v1+json",
-                }
-                ct = suffix_map.get(suffix.upper())
-                if ct and ct in available_types:
-                    return ct
-        except Exception:
-            pass
+        suffix = decode_export_type_suffix(m.group(1))
+        if not suffix:
+            return None
+        ct = EXPORT_SUFFIX_CONTENT_TYPES.get(suffix)
+        if ct and ct in available_types:
+            return ct
         return None
 
 
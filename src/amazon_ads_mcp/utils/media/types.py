@@ -39,6 +39,29 @@ class MediaTypeRegistry:
         self._cache: Dict[
             Tuple[str, str], Tuple[Optional[str], Optional[List[str]]]
         ] = {}
+        # Per-entry (method, template, compiled regex) for templated paths
+        self._templates: List[List[Tuple[str, str, re.Pattern]]] = []
+
+    def _add_entry(
+        self,
+        req_map: Dict[Tuple[str, str], str],
+        resp_map: Dict[Tuple[str, str], List[str]],
+    ) -> None:
+        """Register a request/response map pair and its path templates.
+
+        Only keys containing a ``{param}`` placeholder need regex
+        matching; literal paths are served by the exact lookup, so specs
+        without templates are skipped entirely on the fallback scan.
+        """
+        templates = [
+            (m, p, re.compile(oai_template_to_regex(p)))
+            for m, p in dict.fromkeys([*req_map, *resp_map])
+            if "{" in p
+        ]
+        self._req_entries.append(req_map)
+        self._resp_entries.append(resp_map)
+        self._templates.append(templates)
+        self._cache.clear()
 
     def add_from_spec(self, spec: dict) -> None:
         """Add media type mappings from an OpenAPI specification.
@@ -51,9 +74,7 @@ class MediaTypeRegistry:
         :type spec: dict
         """
         req_map, resp_map = build_media_maps_from_spec(spec)
-        self._req_entries.append(req_map)
-        self._resp_entries.append(resp_map)
-        self._cache.clear()
+        self._add_entry(req_map, resp_map)
 
     def add_from_sidecar(self, sidecar: dict) -> None:
         """Add media type mappings from a sidecar configuration file.
@@ -76,9 +97,7 @@ class MediaTypeRegistry:
             if m and p and isinstance(v, list):
                 resp_map[(m, p)] = list(v)
         if req_map or resp_map:
-            self._req_entries.append(req_map)
-            self._resp_entries.append(resp_map)
-            self._cache.clear()
+            self._add_entry(req_map, resp_map)
 
     def resolve(
         self, method: str, url: str
@@ -107,12 +126,13 @@ class MediaTypeRegistry:
                 result = (req_map.get((m, path)), resp_map.get((m, path)))
                 self._cache[cache_key] = result
                 return result
-        for req_map, resp_map in zip(self._req_entries, self._resp_entries):
-            keys: Set[Tuple[str, str]] = set(req_map.keys()) | set(resp_map.keys())
-            for mm, templated in keys:
+        for req_map, resp_map, templates in zip(
+            self._req_entries, self._resp_entries, self._templates
+        ):
+            for mm, templated, pattern in templates:
                 if mm != m:
                     continue
-                if re.match(oai_template_to_regex(templated), path):
+                if pattern.match(path):
                     result = (
                         req_map.get((mm, templated)),
                         resp_map.get((mm, templated)),
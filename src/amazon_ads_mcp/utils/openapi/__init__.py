@@ -4,12 +4,21 @@ Recommended imports:
     from amazon_ads_mcp.utils.openapi import json_load, deref, oai_template_to_regex, OpenAPISpecLoader
 """
 
-from .json import json_load, oai_template_to_regex
+from .json import (
+    json_dumps,
+    json_dumps_pretty,
+    json_load,
+    json_loads,
+    oai_template_to_regex,
+)
 from .loader import OpenAPISpecLoader
 from .refs import deref
 
 __all__ = [
     "json_load",
+    "json_loads",
+    "json_dumps",
+    "json_dumps_pretty",
     "deref",
     "oai_template_to_regex",
     "OpenAPISpecLoader",
@@ -5,13 +5,38 @@ OpenAPI specifications for the Amazon Ads API, enabling dynamic
 API integration.
 """
 
-import json
 import logging
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, DefaultDict, Dict, List, Optional
+
+from .json import json_dumps_pretty, json_load, write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
+# Header parameters injected by the auth layer, never exposed to tools
+AUTH_HEADERS = frozenset(
+    {
+        "Amazon-Advertising-API-ClientId",
+        "Amazon-Advertising-API-Scope",
+        "Authorization",
+    }
+)
+HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+COMPONENT_TYPES = (
+    "schemas",
+    "parameters",
+    "responses",
+    "examples",
+    "requestBodies",
+    "headers",
+)
+
+
+def _is_auth_header_param(param: Dict[str, Any]) -> bool:
+    """Return True if an operation parameter is an auth header."""
+    return param.get("in") == "header" and param.get("name") in AUTH_HEADERS
+
 
 class OpenAPISpecLoader:
     """Load and merge OpenAPI specifications dynamically.
@@ -33,8 +58,8 @@ class OpenAPISpecLoader:
     def __init__(self, base_path: Path = Path("openapi/amazon_ads_apis")):
         self.base_path = base_path
         self.manifest_path = base_path / "manifest.json"
-        self.specs = {}
-        self.merged_spec = None
+        self.specs: Dict[str, Any] = {}
+        self.merged_spec: Optional[Dict[str, Any]] = None
 
     def load_all_specs(self) -> Dict[str, Any]:
         """Load all OpenAPI specifications from the manifest.
@@ -49,8 +74,7 @@ class OpenAPISpecLoader:
             logger.warning(f"Manifest not found at {self.manifest_path}")
             return self._load_legacy_specs()
 
-        with open(self.manifest_path) as f:
-            manifest = json.load(f)
+        manifest = json_load(self.manifest_path)
 
         logger.info(f"Loading {manifest['successful']} OpenAPI specifications")
 
@@ -61,8 +85,7 @@ class OpenAPISpecLoader:
                 spec_path = self.base_path.parent / spec_info["file"]
                 if spec_path.exists():
                     try:
-                        with open(spec_path) as f:
-                            spec = json.load(f)
+                        spec = json_load(spec_path)
 
                         category = spec_info["category"]
                         resource = spec_info["resource"]
@@ -96,8 +119,7 @@ class OpenAPISpecLoader:
             spec_path = Path(path)
             if spec_path.exists():
                 try:
-                    with open(spec_path) as f:
-                        spec = json.load(f)
+                    spec = json_load(spec_path)
                     self.specs[name] = {
                         "spec": spec,
                         "info": {"resource": name, "category": "legacy"},
@@ -121,7 +143,7 @@ class OpenAPISpecLoader:
             return self.merged_spec
 
         # Base structure
-        merged = {
+        merged: Dict[str, Any] = {
             "openapi": "3.0.1",
             "info": {
                 "title": "Amazon Ads API - Complete",
@@ -176,30 +198,21 @@ class OpenAPISpecLoader:
 
             # Merge components
             if "components" in spec:
-                for component_type in [
-                    "schemas",
-                    "parameters",
-                    "responses",
-                    "examples",
-                    "requestBodies",
-                    "headers",
-                ]:
+                # Add prefix to avoid conflicts
+                prefix = key.replace("/", "_").replace(" ", "_")
+                for component_type in COMPONENT_TYPES:
                     if component_type in spec["components"]:
-                        if component_type not in merged["components"]:
-                            merged["components"][component_type] = {}
-
-                        # Add prefix to avoid conflicts
-                        prefix = key.replace("/", "_").replace(" ", "_")
+                        target = merged["components"].setdefault(
+                            component_type, {}
+                        )
                         for name, component in spec["components"][
                             component_type
                         ].items():
                             # Use original name if no conflict, otherwise prefix it
-                            final_name = name
-                            if name in merged["components"][component_type]:
-                                final_name = f"{prefix}_{name}"
-                            merged["components"][component_type][
-                                final_name
-                            ] = component
+                            final_name = (
+                                f"{prefix}_{name}" if name in target else name
+                            )
+                            target[final_name] = component
 
         self.merged_spec = merged
         logger.info(
@@ -210,52 +223,44 @@ class OpenAPISpecLoader:
 
     def get_categories(self) -> Dict[str, List[str]]:
         """Get all categories and their resources."""
-        categories = {}
+        categories: DefaultDict[str, List[str]] = defaultdict(list)
         for key, spec_data in self.specs.items():
             info = spec_data["info"]
-            category = info.get("category", "unknown")
-            resource = info.get("resource", key)
+            categories[info.get("category", "unknown")].append(
+                info.get("resource", key)
+            )
 
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(resource)
-
-        return categories
+        return dict(categories)
 
     def _remove_auth_headers(
         self, path_item: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Remove authentication headers from path item parameters."""
-        auth_headers = {
-            "Amazon-Advertising-API-ClientId",
-            "Amazon-Advertising-API-Scope",
-            "Authorization",
-        }
-
         processed = {}
         for method, operation in path_item.items():
-            if method in ["get", "post", "put", "delete", "patch"]:
-                processed[method] = operation.copy()
-
-                # Remove auth headers from parameters
-                if "parameters" in operation:
-                    processed[method]["parameters"] = [
-                        param
-                        for param in operation["parameters"]
-                        if not (
-                            param.get("in") == "header"
-                            and param.get("name") in auth_headers
-                        )
-                    ]
+            if method not in HTTP_METHODS:
+                continue
+            processed[method] = operation.copy()
+
+            # Remove auth headers from parameters; most operations carry
+            # none, so keep the original list unless something matches
+            params = operation.get("parameters")
+            if params and any(map(_is_auth_header_param, params)):
+                processed[method]["parameters"] = [
+                    param
+                    for param in params
+                    if not _is_auth_header_param(param)
+                ]
 
         return processed
 
-    def save_merged_spec(self, output_path: Path):
+    def save_merged_spec(self, output_path: Path) -> None:
         """Save the merged specification to a file."""
         merged = self.merge_specs()
-        with open(output_path, "w") as f:
-            json.dump(merged, f, indent=2)
-        logger.info(f"Saved merged spec to {output_path}")
+        if write_bytes_atomic(output_path, json_dumps_pretty(merged)):
+            logger.info(f"Saved merged spec to {output_path}")
+        else:
+            logger.info(f"Merged spec at {output_path} is already up to date")
 
     def load_and_merge_specs(self) -> Dict[str, Any]:
         """Load all specs and return the merged specification."""
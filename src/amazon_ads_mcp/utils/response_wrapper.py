@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 import httpx
 
+from .openapi.json import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,8 +52,8 @@ class ResponseWrapper:
         if self._modified_json is not None:
             return self._modified_json
         if self._modified_content is not None:
-            return json.loads(self._modified_content)
-        return self.original_response.json()
+            return json_loads(self._modified_content)
+        return json_loads(self.original_response.content)
 
     def set_content(self, content: bytes):
         """
@@ -113,7 +115,7 @@ def shape_amc_response(response: httpx.Response) -> httpx.Response:
 
         # Parse response
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except Exception:
             return response
 
@@ -137,7 +139,7 @@ def shape_amc_response(response: httpx.Response) -> httpx.Response:
         if modified:
             # Create a new response with modified content
             # Instead of modifying private _content attribute
-            content_bytes = json.dumps(data).encode("utf-8")
+            content_bytes = json_dumps(data)
 
             # Create new response object
             new_response = httpx.Response(
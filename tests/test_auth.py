@@ -1,7 +1,7 @@
 """Authentication tests aligned to current auth manager and client behavior."""
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
@@ -116,3 +116,31 @@ async def test_authenticated_client_injects_headers(monkeypatch):
     hdrs: httpx.Headers = captured["headers"]
     assert hdrs.get("Authorization", "").startswith("Bearer ")
     assert hdrs.get("Amazon-Advertising-API-ClientId") == "cid"
+
+
+@pytest.mark.asyncio
+async def test_identity_specific_credentials_reused_until_expiry():
+    class CountingProvider(FakeProvider):
+        calls = 0
+
+        def headers_are_identity_specific(self) -> bool:
+            return True
+
+        async def get_identity_credentials(self, identity_id: str):
+            CountingProvider.calls += 1
+            creds = await super().get_identity_credentials(identity_id)
+            creds.expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+            return creds
+
+    am = AuthManager()
+    am.provider = CountingProvider()
+    await am.set_active_identity("id-1")
+    am._active_credentials = None  # singleton state from earlier tests
+    await am.get_headers()
+    await am.get_headers()
+    assert CountingProvider.calls == 1
+
+    # Near expiry the provider is asked again
+    am._active_credentials.expires_at = datetime.now(timezone.utc)
+    await am.get_headers()
+    assert CountingProvider.calls == 2
@@ -164,6 +164,32 @@ class TestDirectProvider:
             # Clean up the token to avoid affecting other tests
             direct_provider._access_token = None
     
+    @pytest.mark.asyncio
+    async def test_direct_provider_token_refresh_retries(self, direct_provider):
+        """Test that a transient token endpoint failure is retried."""
+        import httpx
+
+        endpoint = direct_provider.get_oauth_endpoint()
+        request = httpx.Request("POST", endpoint)
+        unavailable = httpx.Response(503, request=request)
+        ok = httpx.Response(
+            200,
+            json={"access_token": "retried_token", "expires_in": 3600},
+            request=request,
+        )
+
+        with patch.object(direct_provider, "_get_client", new_callable=AsyncMock) as mock_get_client, \
+                patch("amazon_ads_mcp.utils.http.retry.asyncio.sleep", new_callable=AsyncMock):
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(side_effect=[unavailable, ok])
+            mock_get_client.return_value = mock_client
+
+            token = await direct_provider._refresh_access_token()
+
+        assert token.value == "retried_token"
+        assert mock_client.post.call_count == 2
+        direct_provider._access_token = None
+
     @pytest.mark.asyncio
     async def test_direct_provider_token_caching(self, direct_provider):
         """Test that tokens are cached and reused."""
@@ -220,6 +246,31 @@ class TestDirectProvider:
             )):
                 token = await direct_provider.get_token()
                 assert token.value == "fresh_token"
+
+    @pytest.mark.asyncio
+    async def test_direct_provider_concurrent_refresh_shares_exchange(self, direct_provider):
+        """Test that concurrent callers trigger a single token refresh."""
+        import asyncio
+
+        from amazon_ads_mcp.auth.manager import AuthManager
+        AuthManager.reset()
+        direct_provider._access_token = None
+
+        async def fake_refresh():
+            await asyncio.sleep(0)
+            direct_provider._access_token = Token(
+                value="shared_token",
+                expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+                token_type="Bearer"
+            )
+            return direct_provider._access_token
+
+        with patch.object(direct_provider, "_refresh_access_token", side_effect=fake_refresh) as mock_refresh:
+            tokens = await asyncio.gather(*(direct_provider.get_token() for _ in range(5)))
+
+        assert {t.value for t in tokens} == {"shared_token"}
+        assert mock_refresh.call_count == 1
+        direct_provider._access_token = None
     
     @pytest.mark.asyncio
     async def test_direct_provider_list_identities(self, direct_provider):
@@ -392,6 +443,22 @@ class TestOpenBridgeProvider:
             assert len(identities1) == 1
             assert identities1[0].id == "test-1"
 
+    @pytest.mark.asyncio
+    async def test_openbridge_async_context_closes(self, openbridge_provider):
+        """Test that leaving an async with block clears provider state."""
+        from amazon_ads_mcp.models import Identity
+
+        openbridge_provider._identities_cache["k"] = [
+            Identity(id="test-1", type="test", attributes={})
+        ]
+        with pytest.raises(RuntimeError):
+            async with openbridge_provider as provider:
+                assert provider is openbridge_provider
+                raise RuntimeError("boom")
+
+        assert not openbridge_provider._identities_cache
+        assert openbridge_provider._jwt_token is None
+
 
 class TestAuthManagerIntegration:
     """Integration tests for auth manager with providers."""
@@ -183,6 +183,25 @@ class TestAuthenticatedClient:
             assert "advertising-api-eu.amazon.com" in str(sent_request.url)
         set_region_override(None)
     
+    async def test_region_routing_skipped_when_settings_fail(self, authenticated_client):
+        """Unreadable settings must not route a sandbox setup to production."""
+        request = httpx.Request(
+            method="GET",
+            url="https://advertising-api-test.amazon.com/v2/profiles",
+            headers={"Amazon-Advertising-API-MarketplaceId": "A1PA6795UKMFR9"},
+        )
+
+        with patch(
+            "amazon_ads_mcp.utils.http_client.Settings",
+            side_effect=ValueError("bad config"),
+        ), patch.object(httpx.AsyncClient, 'send', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = httpx.Response(200, json=[])
+
+            await authenticated_client.send(request)
+
+            sent_request = mock_send.call_args[0][0]
+            assert sent_request.url.host == "advertising-api-test.amazon.com"
+
     async def test_error_handling(self, authenticated_client):
         """Test error handling when auth headers are missing."""
         request = httpx.Request(
@@ -5,36 +5,43 @@ downloading and processing Amazon Ads API exports.
 """
 
 import asyncio
+import gzip
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from amazon_ads_mcp.utils.export_download_handler import ExportDownloadHandler
 
 
-async def _run_download(tmp_path: Path):
+async def _run_download(tmp_path: Path, headers: dict, body: bytes, url: str):
     h = ExportDownloadHandler(base_dir=tmp_path)
     
-    # Create mock response
-    mock_response = AsyncMock()
-    mock_response.headers = {
-        "content-disposition": 'attachment; filename="report.csv"',
-        "content-type": "text/csv",
-    }
-    mock_response.content = b"a,b\n1,2\n"
+    # Create mock streamed response
+    mock_response = MagicMock()
+    mock_response.headers = headers
     mock_response.raise_for_status = MagicMock()
+
+    async def aiter_bytes(chunk_size=None):
+        # Split the body to exercise incremental handling
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    mock_response.aiter_bytes = aiter_bytes
     
-    # Create mock client with async context manager support
-    mock_client = AsyncMock()
-    mock_client.get = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    # Create mock client whose stream() is an async context manager
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+    stream_ctx.__aexit__ = AsyncMock(return_value=None)
+    mock_client = MagicMock()
+    mock_client.stream = MagicMock(return_value=stream_ctx)
     
-    # Patch the httpx.AsyncClient constructor to return our mock
-    with patch('httpx.AsyncClient') as mock_async_client:
-        mock_async_client.return_value = mock_client
+    # Patch the shared client lookup to return our mock
+    with patch(
+        "amazon_ads_mcp.utils.export_download_handler.get_http_client",
+        AsyncMock(return_value=mock_client),
+    ):
         
         out = await h.download_export(
-            export_url="https://example.com/exports/abc",
+            export_url=url,
             export_id="abc",
             export_type="campaigns",
             metadata={"k": "v"},
@@ -43,7 +50,109 @@ async def _run_download(tmp_path: Path):
 
 
 def test_download_export_writes_file(tmp_path: Path):
-    out = asyncio.run(_run_download(tmp_path))
+    out = asyncio.run(
+        _run_download(
+            tmp_path,
+            {
+                "content-disposition": 'attachment; filename="report.csv"',
+                "content-type": "text/csv",
+            },
+            b"a,b\n1,2\n",
+            "https://example.com/exports/abc",
+        )
+    )
     assert out.exists()
     meta = out.with_suffix(".meta.json")
     assert meta.exists()
+
+
+def test_download_export_trims_preallocated_space(tmp_path: Path):
+    body = b"a,b\n1,2\n"
+    out = asyncio.run(
+        _run_download(
+            tmp_path,
+            {
+                "content-type": "text/csv",
+                # Overstated length must not leave padding in the file
+                "content-length": str(len(body) + 4096),
+            },
+            body,
+            "https://example.com/exports/report.csv",
+        )
+    )
+    assert out.read_bytes() == body
+
+
+def test_download_export_without_preallocation_support(tmp_path: Path):
+    body = b"a,b\n1,2\n"
+    unsupported = OSError(95, "Operation not supported")
+    with patch("os.posix_fallocate", side_effect=unsupported, create=True):
+        out = asyncio.run(
+            _run_download(
+                tmp_path,
+                {
+                    "content-type": "text/csv",
+                    "content-length": str(len(body)),
+                },
+                body,
+                "https://example.com/exports/report.csv",
+            )
+        )
+    assert out.read_bytes() == body
+
+
+def test_download_export_decompresses_gzip(tmp_path: Path):
+    payload = b'[{"campaignId": "1"}, {"campaignId": "2"}]' * 50
+    # Two concatenated members, as gzip.decompress accepts
+    body = gzip.compress(payload) + gzip.compress(payload)
+    out = asyncio.run(
+        _run_download(
+            tmp_path,
+            {"content-type": "application/x-gzip"},
+            body,
+            "https://example.com/exports/export.json.gz",
+        )
+    )
+    assert out.name == "export.json"
+    assert out.read_bytes() == payload * 2
+    assert out.with_name("export.json.gz").read_bytes() == body
+
+
+def test_download_export_retries_transient_errors(tmp_path: Path):
+    import httpx
+
+    h = ExportDownloadHandler(base_dir=tmp_path)
+
+    ok_response = MagicMock()
+    ok_response.headers = {"content-type": "text/csv"}
+    ok_response.raise_for_status = MagicMock()
+
+    async def aiter_bytes(chunk_size=None):
+        yield b"a,b\n"
+
+    ok_response.aiter_bytes = aiter_bytes
+
+    failing = MagicMock()
+    failing.__aenter__ = AsyncMock(side_effect=httpx.ConnectError("reset"))
+    failing.__aexit__ = AsyncMock(return_value=None)
+    ok = MagicMock()
+    ok.__aenter__ = AsyncMock(return_value=ok_response)
+    ok.__aexit__ = AsyncMock(return_value=None)
+    mock_client = MagicMock()
+    mock_client.stream = MagicMock(side_effect=[failing, ok])
+
+    with patch(
+        "amazon_ads_mcp.utils.export_download_handler.get_http_client",
+        AsyncMock(return_value=mock_client),
+    ), patch(
+        "amazon_ads_mcp.utils.export_download_handler.asyncio.sleep",
+        AsyncMock(),
+    ):
+        out = asyncio.run(
+            h.download_export(
+                export_url="https://example.com/exports/report.csv",
+                export_id="abc",
+            )
+        )
+    assert out.read_bytes() == b"a,b\n"
+    assert mock_client.stream.call_count == 2
@@ -35,6 +35,34 @@ def test_http_client_manager_cache_key_stable_same_values():
     _asyncio.run(m.close_all())
 
 
+def test_http_client_manager_shares_ssl_context():
+    m = HTTPClientManager()
+    assert m._get_ssl_context(False) is m._get_ssl_context(False)
+    assert m._get_ssl_context(False) is not m._get_ssl_context(True)
+
+
+def test_http_client_manager_honours_env_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    m = HTTPClientManager()
+    c = asyncio.run(m.get_client(base_url="https://proxied.example.com"))
+    assert c._mounts
+    asyncio.run(m.close_all())
+
+
+def test_http_client_manager_close_one_client_keeps_others():
+    async def scenario():
+        m = HTTPClientManager()
+        c1 = await m.get_client(base_url="https://one.example.com")
+        c2 = await m.get_client(timeout=create_timeout(read=300.0))
+        await c1.aclose()
+        # Each client owns its pool, so closing one leaves the other usable
+        assert c1._transport is not c2._transport
+        assert not c2.is_closed
+        await m.close_all()
+
+    asyncio.run(scenario())
+
+
 def test_async_retry_succeeds_after_failures():
     calls = {"n": 0}
 
@@ -81,7 +109,7 @@ def test_create_limits_defaults():
     limits = create_limits()
     assert limits.max_keepalive_connections == 10
     assert limits.max_connections == 20
-    assert limits.keepalive_expiry == 30.0
+    assert limits.keepalive_expiry == 55.0
 
 
 def test_http_client_manager_singleton():
@@ -133,6 +161,49 @@ def test_retry_jitter_applied():
     assert 0.8 <= sleeps[0] <= 1.2
 
 
+def test_retry_delay_capped():
+    sleeps = []
+
+    async def fake_sleep(d):
+        sleeps.append(d)
+
+    @async_retry(max_attempts=4, delay=10.0, backoff=10.0, max_delay=30.0)
+    async def always_fails():
+        raise httpx.HTTPError("boom")
+
+    with patch("asyncio.sleep", fake_sleep):
+        try:
+            asyncio.run(always_fails())
+            assert False, "Should have raised HTTPError"
+        except httpx.HTTPError:
+            pass
+    assert len(sleeps) == 3
+    assert 8.0 <= sleeps[0] <= 12.0
+    assert sleeps[1] == sleeps[2] == 30.0
+
+
+def test_retry_honors_retry_after():
+    sleeps = []
+
+    async def fake_sleep(d):
+        sleeps.append(d)
+
+    request = httpx.Request("POST", "https://advertising-api.amazon.com/v2/sp/campaigns")
+    response = httpx.Response(429, headers={"Retry-After": "5"}, request=request)
+    calls = {"n": 0}
+
+    @async_retry(max_attempts=2, delay=0.5, max_delay=30.0)
+    async def throttled_once():
+        calls["n"] += 1
+        if calls["n"] < 2:
+            raise httpx.HTTPStatusError("throttled", request=request, response=response)
+        return "ok"
+
+    with patch("asyncio.sleep", fake_sleep):
+        assert asyncio.run(throttled_once()) == "ok"
+    assert sleeps == [5.0]
+
+
 def test_http2_env_toggle_does_not_crash_without_h2():
     m = HTTPClientManager()
     # First with HTTP/2 disabled
@@ -143,3 +214,15 @@ def test_http2_env_toggle_does_not_crash_without_h2():
     c2 = asyncio.run(m.get_client(base_url="https://ex2.com"))
     assert c2 is not None
     _asyncio.run(m.close_all())
+
+
+def test_http2_stays_off_unless_enabled(monkeypatch):
+    monkeypatch.delenv("HTTP_ENABLE_HTTP2", raising=False)
+    # An importable h2 alone must not switch clients to HTTP/2
+    monkeypatch.setattr(
+        "amazon_ads_mcp.utils.http.client_manager._h2_available", lambda: True
+    )
+    m = HTTPClientManager()
+    c = asyncio.run(m.get_client(base_url="https://h1.example.com"))
+    assert not c._transport._pool._http2
+    asyncio.run(m.close_all())
@@ -7,7 +7,18 @@ JSON loading, reference resolution, and template processing.
 import json
 from pathlib import Path
 
-from amazon_ads_mcp.utils.openapi import deref, json_load, oai_template_to_regex
+import pytest
+
+from amazon_ads_mcp.utils.openapi import (
+    deref,
+    json_dumps,
+    json_dumps_pretty,
+    json_load,
+    json_loads,
+    oai_template_to_regex,
+)
+from amazon_ads_mcp.utils.openapi import json as openapi_json
+from amazon_ads_mcp.utils.openapi.json import write_bytes_atomic
 
 
 def test_json_load(tmp_path: Path):
@@ -16,6 +27,41 @@ def test_json_load(tmp_path: Path):
     assert json_load(p) == {"a": 1}
 
 
+def test_json_loads_bytes_and_errors():
+    assert json_loads(b'{"name": "caf\xc3\xa9"}') == {"name": "caf\u00e9"}
+    assert json_loads("[1, 2]") == [1, 2]
+    with pytest.raises(json.JSONDecodeError):
+        json_loads(b"{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_round_trips_compact_bytes(monkeypatch, use_orjson):
+    if not use_orjson:
+        # Same bytes from the stdlib fallback
+        monkeypatch.setattr(openapi_json, "orjson", None)
+    data = {"name": "caf\u00e9", "ids": [1, 2]}
+    out = json_dumps(data)
+    assert out == b'{"name":"caf\xc3\xa9","ids":[1,2]}'
+    assert json_loads(out) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_pretty_writes_utf8(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(openapi_json, "orjson", None)
+    out = json_dumps_pretty({"name": "caf\u00e9", "ids": [1]})
+    assert out == b'{\n  "name": "caf\xc3\xa9",\n  "ids": [\n    1\n  ]\n}'
+
+
+def test_write_bytes_atomic_skips_identical(tmp_path: Path):
+    p = tmp_path / "spec.json"
+    assert write_bytes_atomic(p, b'{"a": 1}') is True
+    assert write_bytes_atomic(p, b'{"a": 1}') is False
+    assert write_bytes_atomic(p, b'{"a": 2}') is True
+    assert p.read_bytes() == b'{"a": 2}'
+    assert list(tmp_path.iterdir()) == [p]
+
+
 def test_deref_and_regex():
     spec = {
         "components": {
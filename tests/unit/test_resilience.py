@@ -349,6 +349,24 @@ class TestResilientRetry:
         assert result == "success"
         assert call_count == 3
     
+    @pytest.mark.asyncio
+    async def test_no_retry_on_bad_request(self):
+        """Test a malformed idempotent request fails without retrying."""
+        call_count = 0
+
+        @ResilientRetry(max_attempts=3, initial_delay=0.01, use_rate_limiter=False)
+        async def test_func(request):
+            nonlocal call_count
+            call_count += 1
+            response = httpx.Response(400)
+            raise httpx.HTTPStatusError("bad request", request=request, response=response)
+
+        request = httpx.Request("GET", "https://advertising-api.amazon.com/v2/keywords")
+        with pytest.raises(httpx.HTTPStatusError):
+            await test_func(request)
+        assert call_count == 1
+        assert get_circuit_breaker("/v2/keywords").failure_count == 0
+
     @pytest.mark.asyncio
     async def test_retry_with_retry_after(self):
         """Test honoring Retry-After header."""
@@ -529,6 +547,34 @@ class TestResilientAuthenticatedClient:
         assert "counters" in client_metrics
         assert "ads_api_throttles_total./v2/campaigns.na" in client_metrics["counters"]
 
+    @pytest.mark.asyncio
+    async def test_response_hook_records_latency(self):
+        """Test every response is recorded through the httpx event hook."""
+        from amazon_ads_mcp.utils.http.resilience import metrics
+
+        auth_manager = MagicMock()
+        auth_manager.get_headers = AsyncMock(return_value={
+            "Authorization": "Bearer token",
+            "Amazon-Advertising-API-ClientId": "client123"
+        })
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        async with ResilientAuthenticatedClient(
+            auth_manager=auth_manager,
+            enable_rate_limiting=False,
+            enable_circuit_breaker=False,
+            transport=transport,
+        ) as client:
+            request = client.build_request(
+                "GET", "https://advertising-api.amazon.com/v2/campaigns"
+            )
+            response = await client.send(request)
+
+        assert response.status_code == 200
+        endpoint, status_code, seconds = metrics.recent_responses()[-1]
+        assert (endpoint, status_code) == ("/v2/campaigns", 200)
+        assert seconds >= 0.0
+        assert metrics.get_metrics()["counters"]["responses_total./v2/campaigns.200"] >= 1
+
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
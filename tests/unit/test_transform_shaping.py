@@ -5,6 +5,9 @@ shapes and processes API responses according to declarative rules.
 """
 
 import asyncio
+from types import SimpleNamespace
+
+import pytest
 
 from amazon_ads_mcp.server.transform_executor import DeclarativeTransformExecutor
 
@@ -22,6 +25,18 @@ async def _call_next_echo(args):
     }
 
 
+@pytest.fixture
+def active_account(monkeypatch):
+    # The page cache is scoped to the active account; pin one
+    am = SimpleNamespace(
+        get_active_identity=lambda: SimpleNamespace(id="ident-1"),
+        get_active_profile_id=lambda: "profile-1",
+    )
+    monkeypatch.setattr(
+        "amazon_ads_mcp.auth.manager.get_auth_manager", lambda: am
+    )
+
+
 def test_call_transform_shapes_output_with_args():
     rules = {"version": "1.0"}
     ex = DeclarativeTransformExecutor("AMCWorkflow", rules)
@@ -37,3 +52,196 @@ def test_call_transform_shapes_output_with_args():
     shaped = run(call_tx(_call_next_echo, {"sample_n": 5}))
     assert len(shaped["items"]) == 5
     assert len(shaped["details"]["columns"]) == 5
+
+
+def test_call_transform_batches_concurrently_in_order():
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+    rule = {"batch": {"size": 2, "path": "body.ids", "concurrency": 3}}
+    call_tx = ex.create_call_transform(rule)
+    in_flight = 0
+    peak = 0
+
+    async def call_next(args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        ids = args["body"]["ids"]
+        # Later chunks finish first; results must keep chunk order
+        await asyncio.sleep(0.01 * (5 - ids[0]))
+        in_flight -= 1
+        if ids[0] == 2:
+            raise RuntimeError("throttled")
+        return {"items": list(ids)}
+
+    out = run(call_tx(call_next, {"body": {"ids": [0, 1, 2, 3, 4]}}))
+    assert out["items"] == [0, 1, 4]
+    assert out["batch_errors"] == [{"chunk": 1, "error": "throttled"}]
+    assert peak == 3
+
+
+def test_call_transform_batches_sequentially_by_default():
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+    in_flight = 0
+    peak = 0
+
+    async def call_next(args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"items": list(args["body"]["ids"])}
+
+    for batch in (
+        {"size": 1, "path": "body.ids"},
+        {"size": 1, "path": "body.ids", "concurrency": 0},
+    ):
+        peak = 0
+        call_tx = ex.create_call_transform({"batch": batch})
+        out = run(call_tx(call_next, {"body": {"ids": [0, 1, 2]}}))
+        assert out["items"] == [0, 1, 2]
+        assert peak == 1
+
+
+def test_call_transform_paginates_body_cursor_into_items():
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+    rule = {
+        "pagination": {
+            "all_pages": True,
+            "param_name": "body.nextToken",
+            "response_key": "nextToken",
+            "items_key": "campaigns",
+        }
+    }
+    call_tx = ex.create_call_transform(rule)
+    pages = {None: (["a", "b"], "t1"), "t1": (["c"], "t2"), "t2": (["d"], None)}
+    seen = []
+
+    async def call_next(args):
+        token = args["body"].get("nextToken")
+        seen.append(token)
+        campaigns, nxt = pages[token]
+        return {"campaigns": campaigns, "nextToken": nxt}
+
+    args = {"body": {"stateFilter": "ENABLED"}}
+    out = run(call_tx(call_next, args))
+    assert out == {"pages": 3, "items": ["a", "b", "c", "d"], "count": 4}
+    assert seen == [None, "t1", "t2"]
+    # Caller's arguments are left untouched
+    assert args == {"body": {"stateFilter": "ENABLED"}}
+
+
+def test_call_transform_resumes_cached_pagination_sweep(active_account):
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+    rule = {
+        "pagination": {
+            "all_pages": True,
+            "param_name": "body.nextToken",
+            "items_key": "campaigns",
+            "max_pages": 2,
+            "cache_ttl_s": 600,
+        }
+    }
+    call_tx = ex.create_call_transform(rule)
+    pages = {None: (["a", "b"], "t1"), "t1": (["c"], "t2"), "t2": (["d"], None)}
+    seen = []
+
+    async def call_next(args):
+        token = args["body"].get("nextToken")
+        seen.append(token)
+        campaigns, nxt = pages[token]
+        return {"campaigns": campaigns, "nextToken": nxt}
+
+    args = {"body": {"stateFilter": "ENABLED"}}
+    first = run(call_tx(call_next, args))
+    assert first["items"] == ["a", "b", "c"]
+    assert first["nextToken"] == "t2"
+
+    # Rerun picks up at the stored cursor, then serves from cache
+    second = run(call_tx(call_next, args))
+    third = run(call_tx(call_next, args))
+    assert second == third == {"pages": 3, "items": ["a", "b", "c", "d"], "count": 4}
+    assert seen == [None, "t1", "t2"]
+
+
+def test_call_transform_page_cache_is_per_rule(active_account):
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+
+    def make_rule(op):
+        return {
+            "match": {"operationId": op},
+            "pagination": {
+                "all_pages": True,
+                "param_name": "nextToken",
+                "items_key": "items",
+                "cache_ttl_s": 600,
+            },
+        }
+
+    campaigns = ex.create_call_transform(make_rule("listCampaigns"))
+    ad_groups = ex.create_call_transform(make_rule("listAdGroups"))
+
+    async def list_campaigns(args):
+        return {"items": ["c1"]}
+
+    async def list_ad_groups(args):
+        return {"items": ["g1"]}
+
+    args = {"stateFilter": "ENABLED"}
+    assert run(campaigns(list_campaigns, args))["items"] == ["c1"]
+    assert run(ad_groups(list_ad_groups, args))["items"] == ["g1"]
+
+
+def test_call_transform_skips_page_cache_without_account(monkeypatch):
+    def no_auth_manager():
+        raise RuntimeError("no auth provider configured")
+
+    monkeypatch.setattr(
+        "amazon_ads_mcp.auth.manager.get_auth_manager", no_auth_manager
+    )
+    ex = DeclarativeTransformExecutor("SP", {"version": "1.0"})
+    rule = {
+        "pagination": {
+            "all_pages": True,
+            "param_name": "nextToken",
+            "items_key": "items",
+            "cache_ttl_s": 600,
+        }
+    }
+    call_tx = ex.create_call_transform(rule)
+    calls = []
+
+    async def call_next(args):
+        calls.append(args)
+        return {"items": [len(calls)]}
+
+    run(call_tx(call_next, {}))
+    run(call_tx(call_next, {}))
+    assert len(calls) == 2
+    assert ex._page_cache == {}
+
+
+def test_input_transform_dispatches_coercions_in_order():
+    ex = DeclarativeTransformExecutor("AMCWorkflow", {"version": "1.0"})
+    rule = {"input_transform": {"coerce": ["enum_case", "iso_to_amc", "unknown"]}}
+    in_tx = ex.create_input_transform(rule)
+    out = run(in_tx({"state": "enabled", "startTime": "2024-01-02"}))
+    assert out["state"] == "ENABLED"
+    assert out["startTime"] == "2024-01-02T00:00:00"
+
+
+def test_apply_preset_results_do_not_share_cached_values(tmp_path, monkeypatch):
+    presets = tmp_path / "config" / "presets" / "AMCWorkflow"
+    presets.mkdir(parents=True)
+    (presets / "base.json").write_text(
+        '{"tags": ["a"], "filters": {"ids": [1]}}'
+    )
+    monkeypatch.chdir(tmp_path)
+    ex = DeclarativeTransformExecutor("AMCWorkflow", {"version": "1.0"})
+
+    first = run(ex._apply_preset({}, "base"))
+    first["tags"].append("MUT")
+    first["filters"]["ids"].append(99)
+
+    second = run(ex._apply_preset({}, "base"))
+    assert second == {"tags": ["a"], "filters": {"ids": [1]}}